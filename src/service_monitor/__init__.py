@@ -26,9 +26,25 @@ __version__ = "0.1.0"
 __author__ = "Seth Lakowske"
 __email__ = "lakowske@gmail.com"
 
+from typing import Any
+
 # Make key classes available at package level
-from .main import app
 from .models import ServiceCheckIn, ServiceInfo, ServiceStatus
 from .storage import InMemoryStorage
 
 __all__ = ["app", "ServiceCheckIn", "ServiceInfo", "ServiceStatus", "InMemoryStorage"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the application on first access to ``service_monitor.app``.
+
+    Importing the package must not build the app: ``python -m service_monitor.main`` runs that
+    module as ``__main__``, and an eager import here would build a second app, storage and
+    manager alongside it.
+    """
+    if name == "app":
+        from .main import app
+
+        return app
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
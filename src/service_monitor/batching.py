@@ -0,0 +1,146 @@
+"""Micro-batching of service check-ins."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Sequence
+from typing import Callable, Optional
+
+from .models import ServiceCheckIn, ServiceInfo, ServiceStatus
+from .storage import InMemoryStorage
+
+logger = logging.getLogger(__name__)
+
+CheckInResult = tuple[ServiceInfo, Optional[ServiceStatus]]
+
+# Upper bounds on how many check-ins are applied together and how long the first one waits
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_DELAY_SECONDS = 0.005
+
+
+class CheckInBatcher:
+    """Collects concurrent check-ins and applies them to storage in a single batch.
+
+    The first check-in of a batch schedules a flush after ``max_delay`` seconds; the batch is
+    flushed early once it holds ``max_batch_size`` check-ins. Each check-in is applied to the
+    storage it was submitted with, in one ``apply_check_ins`` call per storage; a check-in that
+    fails fails only its own caller. Status changes from a batch are handed to ``notify``
+    together, in the background, so callers only wait for the storage update.
+    """
+
+    def __init__(
+        self,
+        notify: Callable[[list[tuple[ServiceInfo, ServiceStatus]]], Awaitable[object]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            notify: Sends notifications for the status changes produced by a batch
+            max_batch_size: Maximum number of check-ins applied together
+            max_delay: Maximum time in seconds the first check-in of a batch waits for others
+        """
+        self._notify = notify
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: list[tuple[InMemoryStorage, ServiceCheckIn, asyncio.Future[CheckInResult]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._notify_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, checkin: ServiceCheckIn, storage: InMemoryStorage) -> CheckInResult:
+        """Queue a check-in and wait for its batch to be applied.
+
+        Args:
+            checkin: Check-in to apply
+            storage: Storage to apply the check-in to
+
+        Returns:
+            Tuple of (updated ServiceInfo object, previous status if changed)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[CheckInResult] = loop.create_future()
+        self._pending.append((storage, checkin, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_delay, self.flush)
+
+        return await future
+
+    async def submit_many(self, checkins: Sequence[ServiceCheckIn], storage: InMemoryStorage) -> list[CheckInResult]:
+        """Apply several check-ins at once, together with any check-ins already pending.
+
+        The check-ins are applied immediately in one batch rather than waiting for the flush delay.
+
+        Args:
+            checkins: Check-ins to apply, in order
+            storage: Storage to apply the check-ins to
+
+        Returns:
+            List of tuples (updated ServiceInfo object, previous status if changed), one per check-in
+        """
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[CheckInResult]] = [loop.create_future() for _ in checkins]
+        self._pending.extend((storage, checkin, future) for checkin, future in zip(checkins, futures))
+        self.flush()
+        return list(await asyncio.gather(*futures))
+
+    def flush(self) -> None:
+        """Apply all pending check-ins now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Almost always a single storage; grouping keeps each storage's check-ins in order
+        groups: dict[InMemoryStorage, list[tuple[ServiceCheckIn, asyncio.Future[CheckInResult]]]] = {}
+        for storage, checkin, future in batch:
+            groups.setdefault(storage, []).append((checkin, future))
+
+        changes: list[tuple[ServiceInfo, ServiceStatus]] = []
+        failures = 0
+        for storage, items in groups.items():
+            # Each check-in succeeds or fails on its own, so one bad item never fails its neighbours
+            results = storage.apply_check_ins([checkin for checkin, _ in items])
+            for (checkin, future), result in zip(items, results):
+                if isinstance(result, Exception):
+                    failures += 1
+                    logger.error(
+                        "Check-in failed - service_name: %s, error: %s", checkin.service_name, result, exc_info=result
+                    )
+                    if not future.done():
+                        future.set_exception(result)
+                    continue
+                if not future.done():
+                    future.set_result(result)
+                service, previous_status = result
+                if previous_status is not None:
+                    changes.append((service, previous_status))
+
+        logger.debug(
+            "Check-in batch applied - size: %d, failed: %d, status_changes: %d", len(batch), failures, len(changes)
+        )
+
+        if changes:
+            task = asyncio.get_running_loop().create_task(self._send_notifications(changes))
+            self._notify_tasks.add(task)
+            task.add_done_callback(self._notify_tasks.discard)
+
+    async def _send_notifications(self, changes: list[tuple[ServiceInfo, ServiceStatus]]) -> None:
+        """Send notifications for a batch's status changes, logging rather than raising failures."""
+        try:
+            await self._notify(changes)
+        except Exception as e:
+            logger.warning("Failed to send notifications for %d services: %s", len(changes), e)
+
+    async def close(self) -> None:
+        """Apply any pending check-ins and wait for in-flight notifications."""
+        self.flush()
+        if self._notify_tasks:
+            with contextlib.suppress(Exception):
+                await asyncio.gather(*self._notify_tasks)
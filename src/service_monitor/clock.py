@@ -0,0 +1,46 @@
+"""Cached wall-clock timestamps for hot paths."""
+
+import time
+from datetime import datetime, timezone
+
+_EPOCH = datetime.fromtimestamp(0, timezone.utc)
+
+# (epoch second, datetime for that second, its ISO 8601 text), replaced as a single tuple so
+# readers never see a torn entry
+_cached_second: tuple[int, datetime, str] = (0, _EPOCH, _EPOCH.isoformat())
+
+
+def _current_second() -> tuple[int, datetime, str]:
+    """Get the cache entry for the current second, rebuilding it when the second has changed."""
+    global _cached_second
+
+    second = int(time.time())
+    cached = _cached_second
+    if cached[0] != second:
+        now = datetime.fromtimestamp(second, timezone.utc)
+        cached = (second, now, now.isoformat())
+        _cached_second = cached
+    return cached
+
+
+def utc_now_seconds() -> datetime:
+    """Get the current UTC time truncated to whole seconds.
+
+    The datetime is built at most once per second and shared between callers, for timestamps
+    that don't need sub-second resolution.
+
+    Returns:
+        Timezone-aware UTC datetime for the current second
+    """
+    return _current_second()[1]
+
+
+def utc_now_seconds_iso() -> str:
+    """Get the current UTC time truncated to whole seconds, in ISO 8601 format.
+
+    Formatted at most once per second, like :func:`utc_now_seconds`.
+
+    Returns:
+        ISO 8601 text of the current second, e.g. ``2024-01-01T12:00:00+00:00``
+    """
+    return _current_second()[2]
@@ -35,6 +35,7 @@ class ServiceMonitorConfig(BaseModel):
         default_factory=NotificationConfig, description="Email notification configuration"
     )
     log_level: str = Field(default="INFO", description="Logging level")
+    max_concurrent_checks: int = Field(default=20, description="Maximum number of health checks run at once")
 
     @classmethod
     def from_env(cls) -> "ServiceMonitorConfig":
@@ -51,11 +52,16 @@ class ServiceMonitorConfig(BaseModel):
             dashboard_base_url=os.getenv("DASHBOARD_BASE_URL", "http://localhost:8000"),
         )
 
-        config = cls(notifications=notifications, log_level=os.getenv("LOG_LEVEL", "INFO"))
+        config = cls(
+            notifications=notifications,
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            max_concurrent_checks=int(os.getenv("MAX_CONCURRENT_CHECKS", "20")),
+        )
 
         logger.info(
-            f"Configuration loaded - notifications_enabled: {config.notifications.enabled}, "
-            f"recipients: {len(config.notifications.recipients)}"
+            "Configuration loaded - notifications_enabled: %s, recipients: %s",
+            config.notifications.enabled,
+            len(config.notifications.recipients),
         )
 
         return config
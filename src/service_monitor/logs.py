@@ -0,0 +1,100 @@
+"""Logging configuration and per-request log context."""
+
+import logging
+import os
+import uuid
+from contextvars import ContextVar
+from typing import Any, Optional
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+TEXT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+
+# Id of the HTTP request being handled, included in JSON log records emitted while serving it
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every log record has; anything else was passed through ``extra=`` and is written as a field
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def json_logging_enabled() -> bool:
+    """Check whether JSON log output was requested with ``LOG_FORMAT=json``.
+
+    Returns:
+        True if log records should be written as JSON lines
+    """
+    return os.environ.get("LOG_FORMAT", "text").lower() == "json"
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects.
+
+    Timestamps are written as raw epoch seconds, skipping the ``localtime``/``strftime`` work of
+    ``%(asctime)s`` on every record. Fields passed with ``extra=`` are written as keys of their own.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON object with the record's time, level, logger, message, request id and extra fields
+        """
+        entry: dict[str, Any] = {
+            "t": record.created,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = request_id_var.get()
+        if request_id is not None:
+            entry["req_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging, as text or as JSON lines depending on ``LOG_FORMAT``.
+
+    Does nothing if the root logger already has handlers, so the first caller wins.
+
+    Args:
+        level: Root logging level
+    """
+    if json_logging_enabled():
+        handler = logging.StreamHandler()
+        handler.setFormatter(JSONFormatter())
+        logging.basicConfig(level=level, handlers=[handler])
+    else:
+        logging.basicConfig(level=level, format=TEXT_LOG_FORMAT)
+
+
+class RequestIdMiddleware:
+    """ASGI middleware that assigns each HTTP request an id for its log records."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection, setting the request id for HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_id_var.set(uuid.uuid4().hex)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_id_var.reset(token)
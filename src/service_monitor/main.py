@@ -4,27 +4,63 @@ import asyncio
 import contextlib
 import logging
 import time
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from starlette.concurrency import run_in_threadpool
 
+from .batching import CheckInBatcher
+from .clock import utc_now_seconds
+from .logs import RequestIdMiddleware, configure_logging, json_logging_enabled
 from .models import HealthResponse, ServiceCheckIn, ServiceInfo, ServiceStatus
 from .monitored_services import MonitoredService, MonitoredServiceManager
 from .notifications import notification_service
-from .storage import InMemoryStorage
+from .storage import DEFAULT_CHECKIN_TIMEOUT_SECONDS, InMemoryStorage
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+
+@contextlib.asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Run background monitoring for the lifetime of the application.
+
+    Args:
+        application: The FastAPI application being served
+    """
+    await notification_service.open()
+    await monitored_services_manager.open()
+
+    logger.info("Starting monitored services health checking")
+    await monitored_services_manager.start_monitoring(storage)
+
+    # Start background task to check for stale services
+    stale_check_task = asyncio.create_task(check_stale_services_loop())
+    logger.info("Started background stale service checker")
+
+    try:
+        yield
+    finally:
+        logger.info("Service Monitor shutting down")
+
+        stale_check_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await stale_check_task
+
+        await checkin_batcher.close()
+        await monitored_services_manager.close()
+        await notification_service.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Service Monitor",
@@ -32,118 +68,236 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Request ids only appear in JSON log records, so text logging skips the middleware
+if json_logging_enabled():
+    app.add_middleware(RequestIdMiddleware)
+
 # Initialize storage and monitored services manager
 storage = InMemoryStorage()
 monitored_services_manager = MonitoredServiceManager()
 
 # Setup templates and static files
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+
+
+@lru_cache(maxsize=1)
+def get_template_environment() -> Environment:
+    """Get the process-wide Jinja environment for the web templates.
+
+    Memoized so every consumer shares one environment and its compiled-template cache. Templates
+    are compiled once, cached as bytecode across restarts, never re-checked on disk, and rendered
+    asynchronously.
+
+    Returns:
+        Environment: Shared template environment
+    """
+    return Environment(
+        loader=FileSystemLoader(BASE_DIR / "templates"),
+        autoescape=select_autoescape(),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+        enable_async=True,
+    )
+
+
+templates = Jinja2Templates(env=get_template_environment())
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
 
+async def render_template(request: Request, name: str, context: dict) -> HTMLResponse:
+    """Render a template asynchronously into an HTML response.
+
+    ``TemplateResponse`` renders synchronously, which an async-enabled environment does not support.
+
+    Args:
+        request: Incoming request, exposed to the template for ``url_for``
+        name: Template name relative to the templates directory
+        context: Template context variables
+
+    Returns:
+        HTMLResponse: Rendered page
+    """
+    template = templates.get_template(name)
+    content = await template.render_async({"request": request, **context})
+    return HTMLResponse(content)
+
+
+def stream_template(request: Request, name: str, context: dict) -> StreamingResponse:
+    """Stream a template to the client as it renders.
+
+    The first bytes go out before the whole page is built, and the event loop regains control
+    between chunks instead of rendering every row in one step.
+
+    Args:
+        request: Incoming request, exposed to the template for ``url_for``
+        name: Template name relative to the templates directory
+        context: Template context variables
+
+    Returns:
+        StreamingResponse: HTML response streamed from the template
+    """
+    template = templates.get_template(name)
+    return StreamingResponse(template.generate_async({"request": request, **context}), media_type="text/html")
+
+
+@lru_cache(maxsize=64)
+def _build_base_url(scheme: str, host: str, root_path: str) -> str:
+    """Join request URL parts into a base URL without a trailing slash."""
+    return f"{scheme}://{host}{root_path}".rstrip("/")
+
+
+def request_base_url(request: Request) -> str:
+    """Resolve the externally visible base URL of the app for a request.
+
+    Built directly from the ASGI scope and memoized per host, avoiding the ``URL`` object
+    that ``request.base_url`` constructs on every call.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Base URL without a trailing slash
+    """
+    host = request.headers.get("host")
+    if host is None:
+        return str(request.base_url).rstrip("/")
+    return _build_base_url(request.scope["scheme"], host, request.scope.get("root_path", ""))
+
+
+def get_storage() -> InMemoryStorage:
+    """Provide the current storage instance to request handlers.
+
+    Returns:
+        InMemoryStorage: The active storage
+    """
+    return storage
+
+
+StorageDep = Annotated[InMemoryStorage, Depends(get_storage)]
+
+
 def reset_storage() -> None:
     """Reset the storage for testing purposes."""
     global storage
     storage = InMemoryStorage()
 
 
-# Track application start time for uptime calculation
-app_start_time = time.time()
+# Concurrent check-ins are applied in batches, each to the storage its handler resolved
+checkin_batcher = CheckInBatcher(notify=notification_service.send_service_notifications_batch)
+
+
+# Status values accepted by the status filter endpoint, computed once at import
+_STATUS_BY_VALUE: dict[str, ServiceStatus] = {status.value: status for status in ServiceStatus}
+_VALID_STATUSES_TEXT = ", ".join(status.value for status in ServiceStatus)
+
+# Track application start time for uptime calculation (monotonic, so wall-clock steps don't skew uptime)
+app_start_time = time.monotonic()
+
+# Distinguishes ETags issued by this process from those issued before a restart
+_etag_boot_id = f"{time.time_ns() // 1_000_000:x}"
+
+# Lets clients and proxies reuse a read for a second, then revalidate it with If-None-Match
+_CACHE_CONTROL = "max-age=1, must-revalidate"
+
+
+def make_etag(version: int) -> str:
+    """Build a weak ETag for a storage version.
+
+    Args:
+        version: Storage or per-service version the response was generated from
+
+    Returns:
+        Weak ETag header value
+    """
+    return f'W/"{_etag_boot_id}-{version}"'
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    """Build the caching headers for a versioned read response.
+
+    Args:
+        etag: ETag of the representation
+
+    Returns:
+        ETag and Cache-Control headers
+    """
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds the current representation.
+
+    Args:
+        request: Incoming request
+        etag: ETag of the current representation
+
+    Returns:
+        Response: 304 Not Modified response, or None if the client's copy is stale
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    if if_none_match.strip() != "*" and etag not in (tag.strip() for tag in if_none_match.split(",")):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
 
-# Background task for checking stale services
-stale_check_task: Optional[asyncio.Task] = None
 
 logger.info("Service Monitor application starting - version: 0.1.0")
 
 
 async def check_stale_services_loop() -> None:
-    """Background task to periodically check for stale services."""
-    logger.info("Starting stale service checker - check interval: 30s, timeout: 150s")
+    """Background task to check for stale services as their check-in deadlines pass."""
+    logger.info("Starting stale service checker - timeout: %ss", DEFAULT_CHECKIN_TIMEOUT_SECONDS)
 
     while True:
         try:
-            await asyncio.sleep(30)  # Check every 30 seconds
+            # Wait until the oldest check-in reaches the timeout instead of polling on a fixed interval
+            await storage.wait_for_stale_deadline(DEFAULT_CHECKIN_TIMEOUT_SECONDS)
 
             # Check for stale services
-            stale_services = storage.check_stale_services(timeout_seconds=150)
+            stale_services = storage.check_stale_services(timeout_seconds=DEFAULT_CHECKIN_TIMEOUT_SECONDS)
 
-            # Send notifications for services that became stale
-            for service_info, previous_status in stale_services:
+            # Send a single batched notification for all services that became stale in this sweep
+            if stale_services:
                 try:
-                    await notification_service.send_service_notification(service_info, previous_status)
-                    logger.info(
-                        f"Notification sent for stale service - service_name: {service_info.service_name}, "
-                        f"previous_status: {previous_status.value}, current_status: {service_info.status.value}"
-                    )
+                    await notification_service.send_service_notifications_batch(stale_services)
+                    logger.info("Notification sent for %d stale services", len(stale_services))
                 except Exception as e:
-                    logger.error(
-                        f"Failed to send notification for stale service {service_info.service_name}: {str(e)}",
-                        exc_info=True,
-                    )
+                    logger.warning("Failed to send notification for stale services: %s", e)
 
         except asyncio.CancelledError:
             logger.info("Stale service checker cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in stale service checker: {str(e)}", exc_info=True)
-
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Handle application startup."""
-    global stale_check_task
-
-    logger.info("Starting monitored services health checking")
-    await monitored_services_manager.start_monitoring(storage)
-
-    # Start background task to check for stale services
-    stale_check_task = asyncio.create_task(check_stale_services_loop())
-    logger.info("Started background stale service checker")
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Handle application shutdown."""
-    logger.info("Service Monitor shutting down")
-
-    # Cancel stale check task
-    if stale_check_task:
-        stale_check_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await stale_check_task
-
-    await monitored_services_manager.close()
-    await notification_service.close()
+            logger.error("Error in stale service checker: %s", e, exc_info=True)
 
 
 # Web Interface Routes
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request) -> HTMLResponse:
+async def dashboard(request: Request, storage: StorageDep) -> StreamingResponse:
     """Main dashboard showing all services."""
-    services = storage.get_all_services()
+    # Copying every service is O(N); keep it off the event loop
+    services = await run_in_threadpool(storage.get_all_services)
 
-    # Count services by status
-    status_counts = {status.value: 0 for status in ServiceStatus}
-    for service in services:
-        status_counts[service.status.value] += 1
-
-    return templates.TemplateResponse(
+    # Counts are maintained by storage on write; the page itself is streamed as it renders
+    return stream_template(
+        request,
         "dashboard.html",
         {
-            "request": request,
             "services": services,
             "total_services": len(services),
-            "status_counts": status_counts,
-            "uptime_seconds": time.time() - app_start_time,
+            "status_counts": storage.get_status_counts(),
+            "uptime_seconds": time.monotonic() - app_start_time,
         },
     )
 
 
 @app.get("/service/{service_name}", response_class=HTMLResponse)
-async def service_detail(request: Request, service_name: str) -> HTMLResponse:
+async def service_detail(request: Request, service_name: str, storage: StorageDep) -> HTMLResponse:
     """Detailed view of a specific service."""
     service = storage.get_service(service_name)
     if service is None:
@@ -152,10 +306,10 @@ async def service_detail(request: Request, service_name: str) -> HTMLResponse:
             detail=f"Service '{service_name}' not found",
         )
 
-    return templates.TemplateResponse(
+    return await render_template(
+        request,
         "service_detail.html",
         {
-            "request": request,
             "service": service,
         },
     )
@@ -163,223 +317,287 @@ async def service_detail(request: Request, service_name: str) -> HTMLResponse:
 
 # Widget Routes
 @app.get("/widgets/summary", response_class=HTMLResponse)
-async def widget_summary(request: Request, theme: str = "light") -> HTMLResponse:
+async def widget_summary(
+    request: Request,
+    storage: StorageDep,
+    dashboard_url: Annotated[str, Depends(request_base_url)],
+    theme: str = "light",
+) -> Response:
     """Summary widget showing status counts."""
-    services = storage.get_all_services()
+    # The counts only move when a service's status or membership changes, not on heartbeats
+    etag = make_etag(storage.status_version)
+    if cached := not_modified(request, etag):
+        return cached
 
-    # Count services by status
-    status_counts = {status.value: 0 for status in ServiceStatus}
-    for service in services:
-        status_counts[service.status.value] += 1
+    status_counts = storage.get_status_counts()
 
-    # Build dashboard URL (use request base URL)
-    dashboard_url = str(request.base_url).rstrip("/")
-
-    return templates.TemplateResponse(
+    response = await render_template(
+        request,
         "widgets/summary.html",
         {
-            "request": request,
             "status_counts": status_counts,
             "dashboard_url": dashboard_url,
             "theme": theme,
         },
     )
+    response.headers.update(cache_headers(etag))
+    return response
 
 
 @app.get("/widgets/critical", response_class=HTMLResponse)
-async def widget_critical(request: Request, theme: str = "light") -> HTMLResponse:
+async def widget_critical(
+    request: Request,
+    storage: StorageDep,
+    dashboard_url: Annotated[str, Depends(request_base_url)],
+    theme: str = "light",
+) -> Response:
     """Critical alerts widget showing only DOWN/DEGRADED services."""
-    # Get services that are down or degraded
-    down_services = storage.get_services_by_status(ServiceStatus.DOWN)
-    degraded_services = storage.get_services_by_status(ServiceStatus.DEGRADED)
-    critical_services = down_services + degraded_services
-
-    # Sort by status (DOWN first, then DEGRADED)
-    critical_services.sort(key=lambda s: (s.status.value != "down", s.service_name))
+    # The widget shows only names and statuses, so heartbeats of critical services keep the ETag
+    etag = make_etag(storage.critical_version)
+    if cached := not_modified(request, etag):
+        return cached
 
-    # Build dashboard URL
-    dashboard_url = str(request.base_url).rstrip("/")
+    # Services that are down or degraded, DOWN first
+    critical_services = storage.get_critical_services()
 
-    return templates.TemplateResponse(
+    response = await render_template(
+        request,
         "widgets/critical.html",
         {
-            "request": request,
             "critical_services": critical_services,
             "dashboard_url": dashboard_url,
             "theme": theme,
         },
     )
+    response.headers.update(cache_headers(etag))
+    return response
 
 
 @app.get("/widgets/service/{service_name}", response_class=HTMLResponse)
-async def widget_service(request: Request, service_name: str, theme: str = "light") -> HTMLResponse:
+async def widget_service(
+    request: Request,
+    service_name: str,
+    storage: StorageDep,
+    base_url: Annotated[str, Depends(request_base_url)],
+    theme: str = "light",
+) -> Response:
     """Single service widget showing detailed information."""
     service = storage.get_service(service_name)
-    if service is None:
+    version = storage.get_service_version(service_name)
+    if service is None or version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Service '{service_name}' not found",
         )
 
+    etag = make_etag(version)
+    if cached := not_modified(request, etag):
+        return cached
+
     # Build service detail URL
-    service_url = f"{str(request.base_url).rstrip('/')}/service/{service_name}"
+    service_url = f"{base_url}/service/{service_name}"
 
-    return templates.TemplateResponse(
+    response = await render_template(
+        request,
         "widgets/service.html",
         {
-            "request": request,
             "service": service,
             "service_url": service_url,
             "theme": theme,
         },
     )
+    response.headers.update(cache_headers(etag))
+    return response
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(storage: StorageDep) -> HealthResponse:
     """Health check endpoint for the service monitor itself.
 
     Returns:
         HealthResponse: Current health status and metrics
     """
-    current_time = datetime.now(timezone.utc)
-    uptime = time.time() - app_start_time
-    monitored_services = storage.get_service_count()
+    uptime = time.monotonic() - app_start_time
 
-    logger.debug(
-        f"Health check requested - uptime: {uptime:.2f}s, monitored_services: {monitored_services}, "
-        f"timestamp: {current_time}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Health check requested - uptime: %.2fs, monitored_services: %d", uptime, storage.get_service_count()
+        )
 
     return HealthResponse(
         status="healthy",
-        timestamp=current_time,
+        timestamp=utc_now_seconds(),
         uptime_seconds=uptime,
-        monitored_services=monitored_services,
+        monitored_services=storage.get_service_count(),
     )
 
 
 @app.post("/services/checkin", response_model=ServiceInfo, status_code=status.HTTP_201_CREATED)
-async def service_checkin(checkin: ServiceCheckIn) -> ServiceInfo:
+async def service_checkin(checkin: ServiceCheckIn, storage: StorageDep) -> ServiceInfo:
     """Handle service check-in requests.
 
     Args:
         checkin: ServiceCheckIn data containing service status information
+        storage: Storage to apply the check-in to
 
     Returns:
         ServiceInfo: Updated service information
 
     Raises:
-        HTTPException: If service name is invalid
+        HTTPException: If the check-in could not be processed
     """
-    if not checkin.service_name.strip():
-        logger.error(f"Invalid service check-in attempt - empty service_name, status: {checkin.status.value}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Service name cannot be empty",
-        )
-
     logger.info(
-        f"Service check-in received - service_name: {checkin.service_name}, status: {checkin.status.value}, "
-        f"message: {checkin.message}"
+        "Service check-in received - service_name: %s, status: %s, message: %s",
+        checkin.service_name,
+        checkin.status.value,
+        checkin.message,
     )
 
     try:
-        service_info, previous_status = storage.update_service(
-            service_name=checkin.service_name,
-            status=checkin.status,
-            message=checkin.message,
-            metadata=checkin.metadata,
-        )
-
-        # Send notification if status changed to a problem state or recovered
-        if previous_status is not None:
-            try:
-                await notification_service.send_service_notification(service_info, previous_status)
-            except Exception as notification_error:
-                logger.error(
-                    f"Failed to send notification for {checkin.service_name}: {str(notification_error)}", exc_info=True
-                )
-                # Don't fail the check-in if notification fails
+        # Notifications for status changes are sent by the batcher once the batch is applied,
+        # and a failed notification never fails the check-in
+        service_info, previous_status = await checkin_batcher.submit(checkin, storage)
 
         logger.info(
-            f"Service check-in processed successfully - service_name: {checkin.service_name}, "
-            f"check_in_count: {service_info.check_in_count}, "
-            f"status_changed: {previous_status is not None}"
+            "Service check-in processed successfully - service_name: %s, check_in_count: %d, status_changed: %s",
+            checkin.service_name,
+            service_info.check_in_count,
+            previous_status is not None,
         )
         return service_info
     except Exception as e:
-        logger.error(f"Service check-in failed - service_name: {checkin.service_name}, error: {str(e)}", exc_info=True)
+        # The batcher has already logged the failure with its traceback
+        logger.error("Service check-in failed - service_name: %s, error: %s", checkin.service_name, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process service check-in",
         ) from e
 
 
-@app.get("/services", response_model=list[ServiceInfo])
-async def get_all_services() -> list[ServiceInfo]:
+@app.post("/services/checkin/bulk", response_model=list[ServiceInfo], status_code=status.HTTP_201_CREATED)
+async def service_checkin_bulk(checkins: list[ServiceCheckIn], storage: StorageDep) -> list[ServiceInfo]:
+    """Handle several service check-ins in one request, e.g. from a collector polling many services.
+
+    The check-ins are applied to storage in a single batch, in order.
+
+    Args:
+        checkins: Check-ins to apply
+        storage: Storage to apply the check-ins to
+
+    Returns:
+        List[ServiceInfo]: Updated service information, one per check-in
+
+    Raises:
+        HTTPException: If the check-ins could not be processed
+    """
+    logger.info("Bulk service check-in received - count: %d", len(checkins))
+
+    try:
+        results = await checkin_batcher.submit_many(checkins, storage)
+    except Exception as e:
+        # The batcher has already logged the failure with its traceback
+        logger.error("Bulk service check-in failed - count: %d, error: %s", len(checkins), e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to process service check-ins",
+        ) from e
+
+    logger.info(
+        "Bulk service check-in processed successfully - count: %d, status_changes: %d",
+        len(results),
+        sum(previous_status is not None for _, previous_status in results),
+    )
+    return [service_info for service_info, _ in results]
+
+
+@app.get("/services", responses={200: {"model": list[ServiceInfo]}})
+async def get_all_services(request: Request, storage: StorageDep) -> Response:
     """Get information about all monitored services.
 
+    The serialized body is cached by the storage until it next changes, so repeated polls between
+    changes skip the storage copy, serialization and the worker thread hop.
+
     Returns:
-        List[ServiceInfo]: List of all registered services
+        List[ServiceInfo]: List of all registered services, or 304 if the client's copy is current
     """
     logger.debug("All services requested")
-    services = storage.get_all_services()
-    logger.info(f"All services retrieved - count: {len(services)}")
-    return services
+    version = storage.version
+    etag = make_etag(version)
+    if cached := not_modified(request, etag):
+        return cached
+
+    body = storage.get_cached_all_services_json()
+    if body is None:
+        # Only services changed since the last build are re-serialized
+        body = await run_in_threadpool(storage.get_all_services_json)
+        logger.info("All services retrieved - count: %d", storage.get_service_count())
 
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag))
 
-@app.get("/services/{service_name}", response_model=ServiceInfo)
-async def get_service(service_name: str) -> ServiceInfo:
+
+@app.get("/services/{service_name}", responses={200: {"model": ServiceInfo}})
+async def get_service(service_name: str, request: Request, storage: StorageDep) -> Response:
     """Get information about a specific service.
 
     Args:
         service_name: Name of the service to retrieve
+        request: Incoming request
+        storage: Storage to read from
 
     Returns:
-        ServiceInfo: Service information
+        ServiceInfo: Service information, or 304 if the client's copy is current
 
     Raises:
         HTTPException: If service is not found
     """
-    logger.debug(f"Service information requested - service_name: {service_name}")
+    logger.debug("Service information requested - service_name: %s", service_name)
     service = storage.get_service(service_name)
-    if service is None:
-        logger.warning(f"Service not found - service_name: {service_name}")
+    version = storage.get_service_version(service_name)
+    if service is None or version is None:
+        logger.warning("Service not found - service_name: %s", service_name)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Service '{service_name}' not found",
         )
-    logger.info(f"Service information retrieved - service_name: {service_name}, status: {service.status.value}")
-    return service
+
+    etag = make_etag(version)
+    if cached := not_modified(request, etag):
+        return cached
+
+    logger.info("Service information retrieved - service_name: %s, status: %s", service_name, service.status.value)
+    # Serialize directly; the stored data is already valid, so response_model re-validation is skipped
+    return Response(content=service.model_dump_json(), media_type="application/json", headers=cache_headers(etag))
 
 
 @app.delete("/services/{service_name}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_service(service_name: str) -> None:
+async def remove_service(service_name: str, storage: StorageDep) -> None:
     """Remove a service from monitoring.
 
     Args:
         service_name: Name of the service to remove
+        storage: Storage to remove the service from
 
     Raises:
         HTTPException: If service is not found
     """
-    logger.info(f"Service removal requested - service_name: {service_name}")
+    logger.info("Service removal requested - service_name: %s", service_name)
     if not storage.remove_service(service_name):
-        logger.warning(f"Service removal failed - service_name: {service_name} not found")
+        logger.warning("Service removal failed - service_name: %s not found", service_name)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Service '{service_name}' not found",
         )
-    logger.info(f"Service removed successfully - service_name: {service_name}")
+    logger.info("Service removed successfully - service_name: %s", service_name)
 
 
-@app.get("/services/status/{status_filter}", response_model=list[ServiceInfo])
-async def get_services_by_status(status_filter: str) -> list[ServiceInfo]:
+@app.get("/services/status/{status_filter}", responses={200: {"model": list[ServiceInfo]}})
+async def get_services_by_status(status_filter: str, request: Request, storage: StorageDep) -> Response:
     """Get all services with a specific status.
 
     Args:
         status_filter: Status to filter by (up, down, degraded, unknown)
+        request: Incoming request
+        storage: Storage to read from
 
     Returns:
         List[ServiceInfo]: List of services with the specified status
@@ -387,40 +605,39 @@ async def get_services_by_status(status_filter: str) -> list[ServiceInfo]:
     Raises:
         HTTPException: If status filter is invalid
     """
-    logger.debug(f"Services by status requested - status_filter: {status_filter}")
-    try:
-        from .models import ServiceStatus
-
-        status_enum = ServiceStatus(status_filter)
-        services = storage.get_services_by_status(status_enum)
-        logger.info(f"Services by status retrieved - status: {status_filter}, count: {len(services)}")
-        return services
-    except ValueError as e:
-        logger.error(f"Invalid status filter - status_filter: {status_filter}, error: {str(e)}")
+    logger.debug("Services by status requested - status_filter: %s", status_filter)
+    # A dict lookup resolves the enum without the constructor's value scan or a raised ValueError
+    status_enum = _STATUS_BY_VALUE.get(status_filter)
+    if status_enum is None:
+        logger.error("Invalid status filter - status_filter: %s", status_filter)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status filter: {status_filter}. Valid values: up, down, degraded, unknown",
-        ) from e
+            detail=f"Invalid status filter: {status_filter}. Valid values: {_VALID_STATUSES_TEXT}",
+        )
+
+    etag = make_etag(storage.version)
+    if cached := not_modified(request, etag):
+        return cached
+
+    # Serialized off the event loop, like GET /services, so a large bucket doesn't stall check-ins
+    body = await run_in_threadpool(storage.get_services_by_status_json, status_enum)
+    logger.info("Services by status retrieved - status: %s", status_filter)
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag))
 
 
 # Notification Management Endpoints
 @app.get("/notifications/history")
-async def get_notification_history() -> dict:
+async def get_notification_history() -> Response:
     """Get notification history for all services."""
-    history = notification_service.get_notification_history()
-    return {
-        "success": True,
-        "history": {
-            service_name: {
-                "service_name": hist.service_name,
-                "last_notification": hist.last_notification.isoformat(),
-                "last_status": hist.last_status.value,
-                "notification_count": hist.notification_count,
-            }
-            for service_name, hist in history.items()
-        },
-        "total_services": len(history),
-    }
+    # The history object is serialized by the notification service and reused until it changes
+    body = orjson.dumps(
+        {
+            "success": True,
+            "history": orjson.Fragment(notification_service.get_notification_history_json()),
+            "total_services": notification_service.get_notification_history_count(),
+        }
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/notifications/test")
@@ -430,7 +647,7 @@ async def send_test_notification(service_name: str = "test-service") -> dict:
     test_service = ServiceInfo(
         service_name=service_name,
         status=ServiceStatus.DOWN,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=utc_now_seconds(),
         message="This is a test notification from the Service Monitor",
         metadata={"source": "test_endpoint", "version": "test"},
         check_in_count=1,
@@ -443,7 +660,7 @@ async def send_test_notification(service_name: str = "test-service") -> dict:
             "message": f"Test notification {'sent' if success else 'failed'} for {service_name}",
         }
     except Exception as e:
-        logger.error(f"Test notification failed: {str(e)}", exc_info=True)
+        logger.warning("Test notification failed: %s", e)
         return {
             "success": False,
             "message": f"Test notification failed: {str(e)}",
@@ -498,16 +715,15 @@ async def get_monitored_service(service_name: str) -> dict:
 
 
 @app.post("/monitored-services")
-async def add_monitored_service(service: MonitoredService) -> dict:
+async def add_monitored_service(service: MonitoredService, storage: StorageDep) -> dict:
     """Add or update a monitored service."""
     # Add the service to configuration
-    monitored_services_manager.add_service(service)
+    await monitored_services_manager.add_service(service)
 
-    # Start monitoring for this service if enabled
-    if service.enabled:
-        await monitored_services_manager.start_monitoring(storage)
+    # (Re)start monitoring for this service only, picking up the new configuration
+    await monitored_services_manager.restart_monitoring_for(service.name, storage)
 
-    logger.info(f"Monitored service added/updated: {service.name}")
+    logger.info("Monitored service added/updated: %s", service.name)
     return {
         "success": True,
         "message": f"Monitored service '{service.name}' added/updated successfully",
@@ -515,8 +731,42 @@ async def add_monitored_service(service: MonitoredService) -> dict:
     }
 
 
+@app.post("/monitored-services/bulk")
+async def bulk_update_monitored_services(services: list[MonitoredService], storage: StorageDep) -> dict:
+    """Add or update several monitored services, saving the configuration once."""
+    await monitored_services_manager.bulk_update(services)
+
+    for service in services:
+        await monitored_services_manager.restart_monitoring_for(service.name, storage)
+
+    logger.info("Monitored services added/updated in bulk: %s", len(services))
+    return {
+        "success": True,
+        "message": f"{len(services)} monitored services added/updated successfully",
+        "services": [service.model_dump() for service in services],
+    }
+
+
+@app.post("/monitored-services/bulk-remove")
+async def bulk_remove_monitored_services(service_names: list[str]) -> dict:
+    """Remove several monitored services, saving the configuration once."""
+    for service_name in service_names:
+        await monitored_services_manager.stop_monitoring(service_name)
+
+    removed = await monitored_services_manager.bulk_remove(service_names)
+    removed_names = set(removed)
+
+    logger.info("Monitored services removed in bulk: %s", len(removed))
+    return {
+        "success": True,
+        "message": f"{len(removed)} monitored services removed successfully",
+        "removed": removed,
+        "not_found": [name for name in service_names if name not in removed_names],
+    }
+
+
 @app.put("/monitored-services/{service_name}")
-async def update_monitored_service(service_name: str, service: MonitoredService) -> dict:
+async def update_monitored_service(service_name: str, service: MonitoredService, storage: StorageDep) -> dict:
     """Update a monitored service configuration."""
     if service.name != service_name:
         raise HTTPException(
@@ -531,17 +781,13 @@ async def update_monitored_service(service_name: str, service: MonitoredService)
             detail=f"Monitored service '{service_name}' not found",
         )
 
-    # Stop monitoring for old configuration
-    await monitored_services_manager.stop_monitoring(service_name)
-
     # Update the service
-    monitored_services_manager.add_service(service)
+    await monitored_services_manager.add_service(service)
 
-    # Restart monitoring if enabled
-    if service.enabled:
-        await monitored_services_manager.start_monitoring(storage)
+    # Reschedule this service so it uses the new configuration (stops it if now disabled)
+    await monitored_services_manager.restart_monitoring_for(service_name, storage)
 
-    logger.info(f"Monitored service updated: {service_name}")
+    logger.info("Monitored service updated: %s", service_name)
     return {
         "success": True,
         "message": f"Monitored service '{service_name}' updated successfully",
@@ -556,13 +802,13 @@ async def delete_monitored_service(service_name: str) -> dict:
     await monitored_services_manager.stop_monitoring(service_name)
 
     # Remove from configuration
-    if not monitored_services_manager.remove_service(service_name):
+    if not await monitored_services_manager.remove_service(service_name):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Monitored service '{service_name}' not found",
         )
 
-    logger.info(f"Monitored service removed: {service_name}")
+    logger.info("Monitored service removed: %s", service_name)
     return {
         "success": True,
         "message": f"Monitored service '{service_name}' removed successfully",
@@ -570,7 +816,7 @@ async def delete_monitored_service(service_name: str) -> dict:
 
 
 @app.post("/monitored-services/{service_name}/check")
-async def check_monitored_service(service_name: str) -> dict:
+async def check_monitored_service(service_name: str, storage: StorageDep) -> dict:
     """Manually trigger a health check for a monitored service."""
     service = monitored_services_manager.get_service(service_name)
     if service is None:
@@ -600,28 +846,36 @@ async def check_monitored_service(service_name: str) -> dict:
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for unhandled errors.
 
+    Starlette only routes exceptions here that no other handler claimed, so HTTPException and
+    request validation errors keep their cheap default handling and never reach this.
+
     Args:
         request: FastAPI request object
         exc: Exception that was raised
 
     Returns:
-        JSONResponse: Error response
+        ORJSONResponse: Error response
     """
     logger.error(
-        f"Unhandled exception - path: {request.url.path}, method: {request.method}, error: {str(exc)}",
+        "Unhandled exception - path: %s, method: %s, error: %s",
+        request.url.path,
+        request.method,
+        exc,
         exc_info=True,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"},
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
+    # Run through the server entry point so `python -m service_monitor.main` and the
+    # `service-monitor` script share one set of uvicorn and logging settings. The app built
+    # by this module is served directly; by import string uvicorn would build a second one.
+    from .server import main
 
-    logger.info("Starting Service Monitor server - host: 0.0.0.0, port: 8000")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    main(app=app)
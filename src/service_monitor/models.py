@@ -1,11 +1,12 @@
 """Data models for the service monitor application."""
 
 import logging
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,19 @@ class ServiceCheckIn(BaseModel):
     message: Optional[str] = Field(None, description="Optional status message")
     metadata: Optional[dict[str, str]] = Field(default_factory=dict, description="Additional metadata")
 
+    @field_validator("service_name")
+    @classmethod
+    def _service_name_not_blank(cls, value: str) -> str:
+        """Reject empty or whitespace-only service names while the body is parsed.
+
+        Accepted names are interned, so storage lookups for a service that checks in repeatedly
+        compare keys by identity rather than character by character.
+        """
+        if not value.strip():
+            msg = "Service name cannot be empty"
+            raise ValueError(msg)
+        return sys.intern(value)
+
 
 class ServiceInfo(BaseModel):
     """Model representing the current state of a monitored service."""
@@ -1,15 +1,22 @@
 """Monitored services configuration and health checking."""
 
 import asyncio
-import json
+import contextlib
+import heapq
+import importlib.util
 import logging
-from datetime import datetime, timezone
+import time
+from collections.abc import AsyncIterator, Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from .clock import utc_now_seconds_iso
+from .config import config
 from .models import ServiceStatus
 
 if TYPE_CHECKING:
@@ -17,6 +24,74 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all health checks, so repeated checks reuse keep-alive connections
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Most concurrent health checks against one origin, so services sharing a host (e.g. several
+# endpoints behind one gateway) reuse its keep-alive connections rather than crowding the pool
+_MAX_CHECKS_PER_ORIGIN = 20
+
+# How long a health check result is reused for callers that accept a cached result
+HEALTH_RESULT_TTL_SECONDS = 2.0
+
+HealthCheckResult = tuple[ServiceStatus, str, dict]
+
+# Longest shutdown waits for cancelled health checks to finish before leaving them behind
+SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=64)
+def _request_timeout(seconds: float) -> httpx.Timeout:
+    """Get the shared httpx timeout for a health check timeout, built once per distinct value."""
+    return httpx.Timeout(seconds)
+
+
+async def _cancel_and_wait(tasks: list[asyncio.Future], timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+    """Cancel tasks and wait a bounded time for them to finish.
+
+    A task that swallows its cancellation or is stuck in blocking code is logged and left
+    behind, so shutdown latency stays bounded.
+
+    Args:
+        tasks: Tasks to cancel
+        timeout: Longest time to wait, in seconds
+    """
+    for task in tasks:
+        task.cancel()
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    if pending:
+        logger.warning("%s health check task(s) did not stop within %ss of cancellation", len(pending), timeout)
+
+
+async def _body_contains(response: httpx.Response, needle: bytes) -> bool:
+    """Check whether a streamed response body contains a byte string.
+
+    The body is scanned chunk by chunk, keeping only enough of the previous chunk to catch a
+    match spanning two chunks, and reading stops as soon as the needle is found.
+
+    Args:
+        response: Response whose body has not been read yet
+        needle: Bytes to search for
+
+    Returns:
+        True if the body contains the needle
+    """
+    keep = len(needle) - 1
+    tail = b""
+    async for chunk in response.aiter_bytes():
+        window = tail + chunk
+        if needle in window:
+            return True
+        tail = window[-keep:] if keep else b""
+    return False
+
 
 class MonitoredService(BaseModel):
     """Configuration for a monitored service."""
@@ -35,6 +110,10 @@ class MonitoredService(BaseModel):
     )
 
 
+# Parses and serializes the whole config file in pydantic-core, without building intermediate dicts
+_CONFIG_ADAPTER = TypeAdapter(list[MonitoredService])
+
+
 class MonitoredServiceManager:
     """Manages monitored services configuration and health checking."""
 
@@ -46,79 +125,157 @@ class MonitoredServiceManager:
         """
         self.config_file = Path(config_file)
         self.services: dict[str, MonitoredService] = {}
-        self.check_tasks: dict[str, asyncio.Task] = {}
-        self._client: Optional[httpx.AsyncClient] = None
+        # Event loop time at which each monitored service's next health check is due
+        self._next_due: dict[str, float] = {}
+        # Min-heap of (due time, service name); entries whose time no longer matches _next_due are stale
+        self._due_heap: list[tuple[float, str]] = []
+        self._scheduler_task: Optional[asyncio.Task] = None
+        # Running scheduled check per service; a service has no deadline queued while its check runs
+        self._check_tasks: dict[str, asyncio.Task[None]] = {}
+        # Set when a service is scheduled, waking a scheduler sleeping until a later deadline
+        self._scheduler_wake: Optional[asyncio.Event] = None
+        self._storage: Optional[InMemoryStorage] = None
+        # Orders config file writes so an older snapshot never replaces a newer one
+        self._save_lock: Optional[asyncio.Lock] = None
+        # Nesting depth of deferred_save blocks, and whether a save was skipped inside them
+        self._save_deferred = 0
+        self._save_pending = False
+        self._client = self._create_client()
+        self._origin_limits: dict[str, asyncio.Semaphore] = {}
+        # Health URLs that answered HEAD with 405/501, so they are probed with GET
+        self._head_unsupported: set[str] = set()
+        # Latest result and in-flight probe per service, each tagged with the configuration it was made for
+        self._result_cache: dict[str, tuple[float, MonitoredService, HealthCheckResult]] = {}
+        self._inflight: dict[str, tuple[MonitoredService, asyncio.Task[HealthCheckResult]]] = {}
         self._load_config()
         logger.info(
-            f"MonitoredServiceManager initialized - config_file: {self.config_file}, services: {len(self.services)}"
+            "MonitoredServiceManager initialized - config_file: %s, services: %s", self.config_file, len(self.services)
+        )
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by all health checks."""
+        return httpx.AsyncClient(
+            follow_redirects=True, http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
         )
 
-    async def get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(follow_redirects=True)
-        return self._client
+    async def open(self) -> None:
+        """Ensure the shared HTTP client is open, recreating it if it was closed."""
+        if self._client.is_closed:
+            self._client = self._create_client()
 
-    async def close(self) -> None:
-        """Close the HTTP client and stop all check tasks."""
-        # Cancel all running check tasks
-        for task in self.check_tasks.values():
-            task.cancel()
+    def _origin_limit(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent health checks against a URL's origin.
+
+        Args:
+            url: Health check URL
+
+        Returns:
+            Semaphore shared by every health check against the same scheme, host and port
+        """
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        limit = self._origin_limits.get(origin)
+        if limit is None:
+            limit = self._origin_limits[origin] = asyncio.Semaphore(_MAX_CHECKS_PER_ORIGIN)
+        return limit
 
-        # Wait for all tasks to complete
-        if self.check_tasks:
-            await asyncio.gather(*self.check_tasks.values(), return_exceptions=True)
+    async def close(self) -> None:
+        """Close the HTTP client and stop the health check scheduler."""
+        await self.stop_monitoring()
+        await _cancel_and_wait([task for _, task in self._inflight.values()])
 
         # Close HTTP client
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self._client.aclose()
+        self._origin_limits.clear()
 
         logger.info("MonitoredServiceManager closed")
 
     def _load_config(self) -> None:
         """Load monitored services configuration from file."""
         if not self.config_file.exists():
-            logger.info(f"No configuration file found at {self.config_file}, starting with empty config")
+            logger.info("No configuration file found at %s, starting with empty config", self.config_file)
             return
 
         try:
-            with self.config_file.open() as f:
-                data = json.load(f)
-
-            for service_data in data:
-                service = MonitoredService(**service_data)
+            for service in _CONFIG_ADAPTER.validate_json(self.config_file.read_bytes()):
                 self.services[service.name] = service
 
-            logger.info(f"Loaded {len(self.services)} monitored services from {self.config_file}")
+            logger.info("Loaded %s monitored services from %s", len(self.services), self.config_file)
 
         except Exception as e:
-            logger.error(f"Failed to load monitored services config: {e}", exc_info=True)
+            logger.error("Failed to load monitored services config: %s", e, exc_info=True)
 
-    def _save_config(self) -> None:
-        """Save monitored services configuration to file."""
-        try:
-            data = [service.model_dump() for service in self.services.values()]
+    async def _save_config(self) -> None:
+        """Save monitored services configuration to file.
+
+        The configuration is serialized on the event loop, so the saved snapshot is consistent,
+        and written from a worker thread so the loop keeps serving requests and health checks.
+        Inside ``deferred_save`` the write is postponed until the outermost block exits.
+        """
+        if self._save_deferred:
+            self._save_pending = True
+            return
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
 
-            with self.config_file.open("w") as f:
-                json.dump(data, f, indent=2)
+        try:
+            payload = _CONFIG_ADAPTER.dump_json(list(self.services.values()), indent=2)
+            async with self._save_lock:
+                await asyncio.to_thread(self._write_config, payload)
 
-            logger.info(f"Saved {len(self.services)} monitored services to {self.config_file}")
+            logger.info("Saved %s monitored services to %s", len(self.services), self.config_file)
 
         except Exception as e:
-            logger.error(f"Failed to save monitored services config: {e}", exc_info=True)
+            logger.error("Failed to save monitored services config: %s", e, exc_info=True)
+
+    def _write_config(self, payload: bytes) -> None:
+        """Atomically replace the configuration file, so readers never see a partial write.
 
-    def add_service(self, service: MonitoredService) -> None:
+        Args:
+            payload: Serialized configuration
+        """
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        tmp_file.write_bytes(payload)
+        tmp_file.replace(self.config_file)
+
+    @contextlib.asynccontextmanager
+    async def deferred_save(self) -> AsyncIterator[None]:
+        """Collapse the config file writes of every change made inside the block into one.
+
+        The file is written once when the outermost block exits, if anything changed, even
+        if the block raised, so the file never falls behind the in-memory configuration.
+
+        Example:
+            ```python
+            async with manager.deferred_save():
+                await manager.add_service(api)
+                await manager.remove_service("worker")
+            ```
+        """
+        self._save_deferred += 1
+        try:
+            yield
+        finally:
+            self._save_deferred -= 1
+            if not self._save_deferred and self._save_pending:
+                self._save_pending = False
+                await self._save_config()
+
+    async def add_service(self, service: MonitoredService) -> None:
         """Add or update a monitored service.
 
         Args:
             service: The monitored service configuration
         """
+        previous = self.services.get(service.name)
+        if previous is not None and previous != service:
+            self._forget_results(previous)
         self.services[service.name] = service
-        self._save_config()
-        logger.info(f"Added/updated monitored service: {service.name}")
+        await self._save_config()
+        logger.info("Added/updated monitored service: %s", service.name)
 
-    def remove_service(self, name: str) -> bool:
+    async def remove_service(self, name: str) -> bool:
         """Remove a monitored service.
 
         Args:
@@ -128,18 +285,47 @@ class MonitoredServiceManager:
             True if service was removed, False if not found
         """
         if name in self.services:
-            # Cancel the check task if running
-            if name in self.check_tasks:
-                self.check_tasks[name].cancel()
-                del self.check_tasks[name]
-
-            del self.services[name]
-            self._save_config()
-            logger.info(f"Removed monitored service: {name}")
+            # Stop scheduling health checks for it
+            self._next_due.pop(name, None)
+
+            self._forget_results(self.services.pop(name))
+            await self._save_config()
+            logger.info("Removed monitored service: %s", name)
             return True
 
         return False
 
+    def _forget_results(self, service: MonitoredService) -> None:
+        """Drop what was learned from probing a removed or replaced service configuration.
+
+        A URL shared with another service loses its HEAD fallback too; it is relearned on the
+        next probe at the cost of one rejected HEAD request.
+        """
+        self._result_cache.pop(service.name, None)
+        self._head_unsupported.discard(service.health_url)
+
+    async def bulk_update(self, services: Iterable[MonitoredService]) -> None:
+        """Add or update several monitored services, writing the config file once.
+
+        Args:
+            services: The monitored service configurations
+        """
+        async with self.deferred_save():
+            for service in services:
+                await self.add_service(service)
+
+    async def bulk_remove(self, names: Iterable[str]) -> list[str]:
+        """Remove several monitored services, writing the config file once.
+
+        Args:
+            names: Names of the services to remove
+
+        Returns:
+            Names of the services that were removed; unknown names are skipped
+        """
+        async with self.deferred_save():
+            return [name for name in names if await self.remove_service(name)]
+
     def get_service(self, name: str) -> Optional[MonitoredService]:
         """Get a monitored service by name.
 
@@ -159,9 +345,73 @@ class MonitoredServiceManager:
         """
         return list(self.services.values())
 
-    async def check_service_health(self, service: MonitoredService) -> tuple[ServiceStatus, str, dict]:
+    async def check_service_health(self, service: MonitoredService, use_cache: bool = True) -> HealthCheckResult:
         """Check the health of a monitored service.
 
+        Concurrent callers share a single probe, and a result younger than
+        ``HEALTH_RESULT_TTL_SECONDS`` is returned without probing again unless ``use_cache`` is off.
+
+        Args:
+            service: The monitored service to check
+            use_cache: Whether a recent result may be returned instead of a new probe
+
+        Returns:
+            Tuple of (status, message, metadata)
+        """
+        name = service.name
+        if use_cache:
+            cached = self._result_cache.get(name)
+            if cached is not None and cached[1] is service and time.monotonic() - cached[0] < HEALTH_RESULT_TTL_SECONDS:
+                return cached[2]
+
+        inflight = self._inflight.get(name)
+        if inflight is None or inflight[0] is not service:
+            task = asyncio.ensure_future(self._probe_health(service))
+            self._inflight[name] = (service, task)
+            task.add_done_callback(lambda done: self._record_result(service, done))
+        else:
+            task = inflight[1]
+
+        # Shielded so a cancelled caller doesn't cancel the probe other callers are waiting on
+        return await asyncio.shield(task)
+
+    def _record_result(self, service: MonitoredService, task: "asyncio.Task[HealthCheckResult]") -> None:
+        """Cache a finished probe's result and clear it from the in-flight probes."""
+        name = service.name
+        inflight = self._inflight.get(name)
+        if inflight is not None and inflight[1] is task:
+            del self._inflight[name]
+        if not task.cancelled() and task.exception() is None:
+            self._result_cache[name] = (time.monotonic(), service, task.result())
+
+    async def _fetch(
+        self, service: MonitoredService, method: str, expected_body: Optional[str]
+    ) -> tuple[httpx.Response, bool]:
+        """Request a service's health URL, scanning the body only when content is expected.
+
+        Args:
+            service: The monitored service to check
+            method: HTTP method to use
+            expected_body: Content the body must contain, or None to skip the body check
+
+        Returns:
+            Tuple of (closed response, whether the body check passed)
+        """
+        body_matched = True
+        async with self._client.stream(
+            method, service.health_url, timeout=_request_timeout(service.timeout_seconds)
+        ) as response:
+            if expected_body and response.status_code == service.expected_status_code:
+                body_matched = await _body_contains(response, expected_body.encode())
+            else:
+                # Drain without buffering so the keep-alive connection can be reused
+                async for _ in response.aiter_raw():
+                    pass
+        return response, body_matched
+
+    async def _probe_health(self, service: MonitoredService) -> HealthCheckResult:
+        """Probe a monitored service's health URL.
+
         Args:
             service: The monitored service to check
 
@@ -170,14 +420,21 @@ class MonitoredServiceManager:
         """
         metadata = {
             "health_url": service.health_url,
-            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checked_at": utc_now_seconds_iso(),
         }
 
         try:
-            client = await self.get_client()
-            logger.debug(f"Checking health of {service.name} at {service.health_url}")
-
-            response = await client.get(service.health_url, timeout=service.timeout_seconds)
+            logger.debug("Checking health of %s at %s", service.name, service.health_url)
+
+            expected_body = service.expected_body_content if service.check_response_body else None
+            # Status-only checks need no body, so they ask for headers alone where the server allows it
+            method = "GET" if expected_body or service.health_url in self._head_unsupported else "HEAD"
+            async with self._origin_limit(service.health_url):
+                response, body_matched = await self._fetch(service, method, expected_body)
+                if method == "HEAD" and response.status_code in (405, 501):
+                    logger.debug("HEAD not supported by %s, using GET from now on", service.health_url)
+                    self._head_unsupported.add(service.health_url)
+                    response, body_matched = await self._fetch(service, "GET", expected_body)
 
             metadata.update(
                 {
@@ -189,7 +446,10 @@ class MonitoredServiceManager:
             # Check status code
             if response.status_code != service.expected_status_code:
                 logger.warning(
-                    f"Service {service.name} returned unexpected status code: {response.status_code} (expected {service.expected_status_code})"
+                    "Service %s returned unexpected status code: %s (expected %s)",
+                    service.name,
+                    response.status_code,
+                    service.expected_status_code,
                 )
                 return (
                     ServiceStatus.DEGRADED,
@@ -198,17 +458,15 @@ class MonitoredServiceManager:
                 )
 
             # Check response body if configured
-            if service.check_response_body and service.expected_body_content:
-                body = response.text
-                if service.expected_body_content not in body:
-                    logger.warning(f"Service {service.name} response does not contain expected content")
-                    return (
-                        ServiceStatus.DEGRADED,
-                        "Response body missing expected content",
-                        metadata,
-                    )
-
-            logger.debug(f"Service {service.name} health check passed")
+            if not body_matched:
+                logger.warning("Service %s response does not contain expected content", service.name)
+                return (
+                    ServiceStatus.DEGRADED,
+                    "Response body missing expected content",
+                    metadata,
+                )
+
+            logger.debug("Service %s health check passed", service.name)
             return (
                 ServiceStatus.UP,
                 f"Health check passed ({response.status_code})",
@@ -216,7 +474,7 @@ class MonitoredServiceManager:
             )
 
         except httpx.TimeoutException:
-            logger.error(f"Health check timeout for {service.name} after {service.timeout_seconds}s")
+            logger.error("Health check timeout for %s after %ss", service.name, service.timeout_seconds)
             return (
                 ServiceStatus.DOWN,
                 f"Health check timed out after {service.timeout_seconds}s",
@@ -224,7 +482,7 @@ class MonitoredServiceManager:
             )
 
         except httpx.ConnectError as e:
-            logger.error(f"Connection error checking {service.name}: {e}")
+            logger.error("Connection error checking %s: %s", service.name, e)
             return (
                 ServiceStatus.DOWN,
                 "Cannot connect to service",
@@ -232,7 +490,7 @@ class MonitoredServiceManager:
             )
 
         except Exception as e:
-            logger.error(f"Unexpected error checking {service.name}: {e}", exc_info=True)
+            logger.error("Unexpected error checking %s: %s", service.name, e, exc_info=True)
             return (
                 ServiceStatus.DOWN,
                 f"Unexpected error: {str(e)}",
@@ -248,10 +506,37 @@ class MonitoredServiceManager:
         logger.info("Starting monitoring for all enabled services")
 
         for service in self.services.values():
-            if service.enabled and service.name not in self.check_tasks:
-                task = asyncio.create_task(self._monitor_service_loop(service, storage))
-                self.check_tasks[service.name] = task
-                logger.info(f"Started monitoring task for {service.name}")
+            await self.start_monitoring_for(service, storage)
+
+    async def start_monitoring_for(self, service: MonitoredService, storage: "InMemoryStorage") -> None:
+        """Start monitoring a single service if it is enabled and not already being monitored.
+
+        The service's first health check is due immediately.
+
+        Args:
+            service: The monitored service configuration
+            storage: The storage instance to update service status
+        """
+        self._storage = storage
+        if service.enabled and service.name not in self._next_due:
+            self._schedule(service.name, asyncio.get_running_loop().time())
+            if self._scheduler_task is None or self._scheduler_task.done():
+                self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+            logger.info("Scheduled health checks for %s", service.name)
+
+    async def restart_monitoring_for(self, service_name: str, storage: "InMemoryStorage") -> None:
+        """Restart monitoring of a single service with its current configuration.
+
+        Only this service is rescheduled; other services keep their schedule undisturbed.
+
+        Args:
+            service_name: Name of the service to restart monitoring for
+            storage: The storage instance to update service status
+        """
+        await self.stop_monitoring(service_name)
+        service = self.services.get(service_name)
+        if service is not None:
+            await self.start_monitoring_for(service, storage)
 
     async def stop_monitoring(self, service_name: Optional[str] = None) -> None:
         """Stop monitoring for a specific service or all services.
@@ -260,46 +545,160 @@ class MonitoredServiceManager:
             service_name: Name of service to stop monitoring, or None to stop all
         """
         if service_name:
-            if service_name in self.check_tasks:
-                self.check_tasks[service_name].cancel()
-                del self.check_tasks[service_name]
-                logger.info(f"Stopped monitoring task for {service_name}")
+            stopped = self._next_due.pop(service_name, None) is not None
+            check = self._check_tasks.pop(service_name, None)
+            if check is not None:
+                await _cancel_and_wait([check])
+            if stopped:
+                logger.info("Stopped health checks for %s", service_name)
         else:
-            for _name, task in list(self.check_tasks.items()):
-                task.cancel()
-            self.check_tasks.clear()
+            self._next_due.clear()
+            self._due_heap.clear()
+            tasks: list[asyncio.Future] = list(self._check_tasks.values())
+            self._check_tasks.clear()
+            if self._scheduler_task is not None:
+                tasks.append(self._scheduler_task)
+                self._scheduler_task = None
+            await _cancel_and_wait(tasks)
             logger.info("Stopped all monitoring tasks")
 
-    async def _monitor_service_loop(self, service: MonitoredService, storage: "InMemoryStorage") -> None:
-        """Background loop to periodically check a service.
+    def _schedule(self, service_name: str, due_at: float) -> None:
+        """Set the time a service's next health check is due.
 
         Args:
-            service: The monitored service configuration
-            storage: The storage instance to update service status
+            service_name: Name of the service
+            due_at: Event loop time at which the check is due
+        """
+        self._next_due[service_name] = due_at
+        heapq.heappush(self._due_heap, (due_at, service_name))
+        if self._scheduler_wake is not None:
+            self._scheduler_wake.set()
+
+    def _pop_due(self, now: float) -> list[tuple[MonitoredService, float]]:
+        """Pop every service whose health check is due, dropping stale heap entries on the way.
+
+        Only entries at or before ``now`` are visited, so a pass costs O(k log n) for k due
+        services rather than a scan of every monitored service.
+
+        Args:
+            now: Current event loop time
+
+        Returns:
+            List of (service, due time) pairs to check
         """
-        logger.info(f"Starting monitor loop for {service.name} - interval: {service.check_interval_seconds}s")
+        heap = self._due_heap
+        due: dict[str, tuple[MonitoredService, float]] = {}
+        while heap and heap[0][0] <= now:
+            due_at, name = heapq.heappop(heap)
+            if self._next_due.get(name) != due_at:
+                continue
+            service = self.services.get(name)
+            if service is None or not service.enabled:
+                del self._next_due[name]
+                continue
+            due[name] = (service, due_at)
+
+        # Leave a live entry on top so the next deadline can be read from it
+        while heap and self._next_due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return list(due.values())
+
+    async def _scheduler_loop(self) -> None:
+        """Background loop starting every due health check as its own task.
+
+        Each pass starts the checks of all services whose deadline has passed without waiting for
+        them, then sleeps until the earliest remaining deadline, so a slow probe never delays
+        other services. At most ``max_concurrent_checks`` checks run at a time.
+        """
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(config.max_concurrent_checks)
+        if self._scheduler_wake is None:
+            self._scheduler_wake = asyncio.Event()
+        logger.info("Health check scheduler started - max_concurrent_checks: %s", config.max_concurrent_checks)
 
         while True:
-            try:
-                # Check service health
-                status, message, metadata = await self.check_service_health(service)
-
-                # Update service status in storage
-                storage.update_service(
-                    service_name=service.name,
-                    status=status,
-                    message=message,
-                    metadata=metadata,
-                )
+            self._scheduler_wake.clear()
+            storage = self._storage
+            if storage is not None:
+                for service, due_at in self._pop_due(loop.time()):
+                    self._start_check(service, due_at, storage, limit)
+
+            # A running check queues its service's next deadline when it finishes, waking this loop
+            timeout = self._due_heap[0][0] - loop.time() if self._due_heap else None
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._scheduler_wake.wait(), timeout)
+
+    def _start_check(
+        self, service: MonitoredService, due_at: float, storage: "InMemoryStorage", limit: asyncio.Semaphore
+    ) -> None:
+        """Start a due health check as a tracked task."""
+        task = asyncio.create_task(self._run_check(service, due_at, storage, limit))
+        self._check_tasks[service.name] = task
+        task.add_done_callback(lambda done: self._check_finished(service.name, done))
+
+    def _check_finished(self, service_name: str, task: "asyncio.Task[None]") -> None:
+        """Forget a finished health check task, logging it if it failed."""
+        if self._check_tasks.get(service_name) is task:
+            del self._check_tasks[service_name]
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error("Error running health check for %s: %s", service_name, error, exc_info=error)
+
+    async def _run_check(
+        self, service: MonitoredService, due_at: float, storage: "InMemoryStorage", limit: asyncio.Semaphore
+    ) -> None:
+        """Check a service's health, record the result and schedule its next check.
+
+        Args:
+            service: The monitored service configuration
+            due_at: Deadline the check was scheduled for
+            storage: The storage instance to update service status
+            limit: Semaphore bounding concurrent health checks
+        """
+        try:
+            async with limit:
+                status, message, metadata = await self.check_service_health(service, use_cache=False)
+
+            # Drop the result if the service was stopped or rescheduled while the check ran
+            if self._next_due.get(service.name) != due_at:
+                return
+
+            storage.update_service(
+                service_name=service.name,
+                status=status,
+                message=message,
+                metadata=metadata,
+            )
+            logger.debug("Updated status for %s: %s - %s", service.name, status.value, message)
+        finally:
+            if self._next_due.get(service.name) == due_at:
+                self._schedule(service.name, self._next_deadline(service, due_at))
 
-                logger.debug(f"Updated status for {service.name}: {status.value} - {message}")
+    @staticmethod
+    def _next_deadline(service: MonitoredService, due_at: float) -> float:
+        """Get the deadline following a completed health check.
 
-            except asyncio.CancelledError:
-                logger.info(f"Monitor loop cancelled for {service.name}")
-                raise
+        Deadlines advance by whole intervals from the previous deadline, so the time a check
+        takes never shifts the cadence. A service that fell more than an interval behind (e.g.
+        while the event loop was blocked) is resynced to one interval from now instead of
+        running back-to-back catch-up checks.
 
-            except Exception as e:
-                logger.error(f"Error in monitor loop for {service.name}: {e}", exc_info=True)
+        Args:
+            service: The monitored service configuration
+            due_at: Deadline the completed check was scheduled for
 
-            # Wait for next check interval
-            await asyncio.sleep(service.check_interval_seconds)
+        Returns:
+            Event loop time at which the next check is due
+        """
+        interval = service.check_interval_seconds
+        now = asyncio.get_running_loop().time()
+        next_due = due_at + interval
+        if next_due < now - interval:
+            logger.warning(
+                "Health checks for %s fell %.1fs behind schedule, resyncing to a %ss interval from now",
+                service.name,
+                now - due_at,
+                interval,
+            )
+            return now + interval
+        return next_due
@@ -2,25 +2,104 @@
 
 import asyncio
 import logging
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 
 import httpx
-from pydantic import BaseModel
+import orjson
+from jinja2 import Environment, FileSystemLoader
 
 from .config import config
 from .models import ServiceInfo, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared Gmail API client
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
 
-class NotificationHistory(BaseModel):
-    """Track notification history to prevent spam."""
+# Most emails sent to the Gmail API at once for a single notification
+_MAX_CONCURRENT_SENDS = 10
+
+# Upper bound on the wait between email send attempts
+_MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Statuses that trigger an alert, and from which a return to UP is a recovery
+_BAD_STATES = frozenset({ServiceStatus.DOWN, ServiceStatus.DEGRADED})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds, ignoring the HTTP-date form."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Get the wait before the next email send attempt.
+
+    A server-provided Retry-After wins; otherwise the delay is drawn with full jitter from an
+    exponentially growing window, so clients retrying after the same failure spread out.
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        retry_after: Seconds the server asked clients to wait, if it said
+
+    Returns:
+        Delay in seconds, at most ``_MAX_RETRY_DELAY_SECONDS``
+    """
+    if retry_after is not None:
+        return min(_MAX_RETRY_DELAY_SECONDS, retry_after)
+    window = config.notifications.retry_delay_seconds * 2**attempt
+    return min(_MAX_RETRY_DELAY_SECONDS, random.uniform(0, window))  # noqa: S311 - jitter, not security
+
+
+_STATUS_EMOJI = {
+    ServiceStatus.UP: "✅",
+    ServiceStatus.DOWN: "❌",
+    ServiceStatus.DEGRADED: "⚠️",
+    ServiceStatus.UNKNOWN: "❓",
+}
+_ALERT_SUBJECT_PREFIX = "🚨 Service Alert: "
+_RECOVERY_SUBJECT_PREFIX = "🎉 Service Recovered: "
+_UPDATE_SUBJECT_PREFIX = "🔔 Service Status Update: "
+_RECOVERY_COLOR = "#48bb78"  # Green
+_DOWN_COLOR = "#f56565"  # Red
+_DEGRADED_COLOR = "#ed8936"  # Orange
+
+# Email templates are compiled on first use and reused for every notification
+_EMAIL_TEMPLATES = Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parent / "templates"),
+    autoescape=True,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+@dataclass
+class NotificationHistory:
+    """Track notification history to prevent spam.
+
+    A slotted record rather than a pydantic model: one is kept per notified service and it is
+    never validated or serialized directly.
+    """
+
+    __slots__ = ("service_name", "last_notification", "last_status", "notification_count", "next_allowed_monotonic")
 
     service_name: str
     last_notification: datetime
     last_status: ServiceStatus
-    notification_count: int = 0
+    notification_count: int
+    # time.monotonic() value before which further alerts for the service are held back
+    next_allowed_monotonic: float
 
 
 class EmailNotificationService:
@@ -29,12 +108,26 @@ class EmailNotificationService:
     def __init__(self) -> None:
         """Initialize the email notification service."""
         self._notification_history: dict[str, NotificationHistory] = {}
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # Serialized history, rebuilt on the first read after the history changes
+        self._history_json: Optional[bytes] = None
+        self._client = self._create_client()
+        self._send_url = f"{config.notifications.gmail_api_url}/api/emails/send"
         logger.info(
-            f"EmailNotificationService initialized - enabled: {config.notifications.enabled}, "
-            f"recipients: {config.notifications.recipients}"
+            "EmailNotificationService initialized - enabled: %s, recipients: %s",
+            config.notifications.enabled,
+            config.notifications.recipients,
         )
 
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by all notification sends."""
+        return httpx.AsyncClient(timeout=30.0, limits=_HTTP_LIMITS)
+
+    async def open(self) -> None:
+        """Ensure the shared HTTP client is open, recreating it if it was closed."""
+        if self._client.is_closed:
+            self._client = self._create_client()
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._client.aclose()
@@ -42,79 +135,76 @@ class EmailNotificationService:
     def _should_send_notification(self, service: ServiceInfo, previous_status: Optional[ServiceStatus] = None) -> bool:
         """Determine if a notification should be sent for this service status change."""
         if not config.notifications.enabled:
-            logger.debug(f"Notifications disabled - skipping for {service.service_name}")
+            logger.debug("Notifications disabled - skipping for %s", service.service_name)
             return False
 
         # Get notification history for this service
         history = self._notification_history.get(service.service_name)
-        current_time = datetime.now(timezone.utc)
 
         # If no previous status provided, check history
         if previous_status is None and history:
             previous_status = history.last_status
 
         # Don't send notification if status hasn't changed
-        if previous_status == service.status:
-            logger.debug(f"No status change for {service.service_name} - skipping notification")
+        if previous_status is service.status:
+            logger.debug("No status change for %s - skipping notification", service.service_name)
             return False
 
         # Check if this is a recovery notification (UP from DOWN/DEGRADED)
-        is_recovery = (
-            previous_status in [ServiceStatus.DOWN, ServiceStatus.DEGRADED] and service.status == ServiceStatus.UP
-        )
+        is_recovery = previous_status in _BAD_STATES and service.status is ServiceStatus.UP
 
         # Check if this is an alert notification (DOWN or DEGRADED)
-        is_alert = service.status in [ServiceStatus.DOWN, ServiceStatus.DEGRADED]
+        is_alert = service.status in _BAD_STATES
 
         # Determine if we should send this notification type
         should_send = False
         if is_alert:
-            logger.info(f"Alert notification triggered for {service.service_name} - status: {service.status.value}")
+            logger.info("Alert notification triggered for %s - status: %s", service.service_name, service.status.value)
             should_send = True
         elif is_recovery and config.notifications.send_recovery_notifications:
-            logger.info(f"Recovery notification triggered for {service.service_name}")
+            logger.info("Recovery notification triggered for %s", service.service_name)
             should_send = True
         else:
-            logger.debug(f"No notification needed for {service.service_name} - status: {service.status.value}")
+            logger.debug("No notification needed for %s - status: %s", service.service_name, service.status.value)
             return False
 
         # Apply cooldown check ONLY for alert notifications, NOT for recovery notifications
         # Recovery notifications bypass cooldown so users know immediately when services recover
-        if should_send and is_alert and history:
-            time_since_last = (current_time - history.last_notification).total_seconds() / 60
-            if time_since_last < config.notifications.cooldown_minutes:
-                logger.debug(
-                    f"Cooldown active for {service.service_name} - "
-                    f"{time_since_last:.1f}min < {config.notifications.cooldown_minutes}min"
-                )
-                return False
+        if should_send and is_alert and history and time.monotonic() < history.next_allowed_monotonic:
+            logger.debug(
+                "Cooldown active for %s - %.1fmin remaining",
+                service.service_name,
+                (history.next_allowed_monotonic - time.monotonic()) / 60,
+            )
+            return False
 
         return should_send
 
     def _generate_email_content(self, service: ServiceInfo, is_recovery: bool = False) -> tuple[str, str, str]:
         """Generate email subject, plain text, and HTML content."""
-        status_emoji = {
-            ServiceStatus.UP: "✅",
-            ServiceStatus.DOWN: "❌",
-            ServiceStatus.DEGRADED: "⚠️",
-            ServiceStatus.UNKNOWN: "❓",
-        }
+        emoji = _STATUS_EMOJI[service.status]
+        status_text = service.status.value.upper()
 
         if is_recovery:
-            subject = f"🎉 Service Recovered: {service.service_name}"
+            subject = _RECOVERY_SUBJECT_PREFIX + service.service_name
             action = "recovered and is now"
-            color = "#48bb78"  # Green
+            color = _RECOVERY_COLOR
         else:
-            subject = f"🚨 Service Alert: {service.service_name} is {service.status.value.upper()}"
+            subject = f"{_ALERT_SUBJECT_PREFIX}{service.service_name} is {status_text}"
             action = "is now"
-            color = "#f56565" if service.status == ServiceStatus.DOWN else "#ed8936"  # Red or Orange
+            color = _DOWN_COLOR if service.status is ServiceStatus.DOWN else _DEGRADED_COLOR
+
+        check_in_time = service.last_check_in.strftime("%Y-%m-%d %H:%M:%S UTC")
+        dashboard_url = None
+        if config.notifications.include_dashboard_link:
+            dashboard_url = f"{config.notifications.dashboard_base_url}/service/{service.service_name}"
 
         # Plain text content
         plain_text = f"""Service Monitor Alert
 
 Service: {service.service_name}
-Status: {status_emoji[service.status]} {service.status.value.upper()}
-Time: {service.last_check_in.strftime('%Y-%m-%d %H:%M:%S UTC')}
+Status: {emoji} {status_text}
+Time: {check_in_time}
 Check-ins: {service.check_in_count}
 """
 
@@ -126,131 +216,68 @@ Check-ins: {service.check_in_count}
             for key, value in service.metadata.items():
                 plain_text += f"  {key}: {value}\n"
 
-        if config.notifications.include_dashboard_link:
-            dashboard_url = f"{config.notifications.dashboard_base_url}/service/{service.service_name}"
+        if dashboard_url:
             plain_text += f"\nView Details: {dashboard_url}"
 
         # HTML content
-        metadata_html = ""
-        if service.metadata:
-            metadata_rows = "".join(
-                [
-                    f"<tr><td style='padding: 4px 8px; border-bottom: 1px solid #eee;'><strong>{key}:</strong></td>"
-                    f"<td style='padding: 4px 8px; border-bottom: 1px solid #eee;'>{value}</td></tr>"
-                    for key, value in service.metadata.items()
-                ]
-            )
-            metadata_html = f"""
-            <h3 style='color: #333; margin: 20px 0 10px 0;'>Metadata</h3>
-            <table style='width: 100%; border-collapse: collapse; margin-bottom: 20px;'>
-                {metadata_rows}
-            </table>
-            """
-
-        dashboard_link_html = ""
-        if config.notifications.include_dashboard_link:
-            dashboard_url = f"{config.notifications.dashboard_base_url}/service/{service.service_name}"
-            dashboard_link_html = f"""
-            <div style='text-align: center; margin: 30px 0;'>
-                <a href='{dashboard_url}'
-                   style='background: #4299e1; color: white; padding: 12px 24px; text-decoration: none;
-                          border-radius: 6px; display: inline-block; font-weight: 500;'>
-                    View Service Details
-                </a>
-            </div>
-            """
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{subject}</title>
-        </head>
-        <body style='font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-                    line-height: 1.6; margin: 0; padding: 0; background: #f8fafc;'>
-            <div style='max-width: 600px; margin: 0 auto; background: white; border-radius: 8px;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1); overflow: hidden;'>
-
-                <!-- Header -->
-                <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                           color: white; padding: 20px; text-align: center;'>
-                    <h1 style='margin: 0; font-size: 24px;'>🔍 Service Monitor</h1>
-                </div>
-
-                <!-- Alert Banner -->
-                <div style='background: {color}; color: white; padding: 15px; text-align: center; font-weight: 500;'>
-                    <div style='font-size: 18px;'>{status_emoji[service.status]} {service.service_name} {action} {service.status.value.upper()}</div>
-                </div>
-
-                <!-- Content -->
-                <div style='padding: 20px;'>
-                    <h2 style='color: #2d3748; margin: 0 0 20px 0; font-size: 20px;'>Service Details</h2>
-
-                    <table style='width: 100%; border-collapse: collapse; margin-bottom: 20px;'>
-                        <tr>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0; width: 30%;'>
-                                <strong>Service:</strong>
-                            </td>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                {service.service_name}
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                <strong>Status:</strong>
-                            </td>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                <span style='background: {color}; color: white; padding: 4px 8px;
-                                           border-radius: 12px; font-size: 12px; font-weight: 500;'>
-                                    {status_emoji[service.status]} {service.status.value.upper()}
-                                </span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                <strong>Time:</strong>
-                            </td>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                {service.last_check_in.strftime('%Y-%m-%d %H:%M:%S UTC')}
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                <strong>Check-ins:</strong>
-                            </td>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                {service.check_in_count}
-                            </td>
-                        </tr>
-                        {f'''<tr>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;'>
-                                <strong>Message:</strong>
-                            </td>
-                            <td style='padding: 8px 12px; border-bottom: 1px solid #e2e8f0;
-                                     font-style: italic; color: #4a5568;'>
-                                {service.message}
-                            </td>
-                        </tr>''' if service.message else ''}
-                    </table>
-
-                    {metadata_html}
-
-                    {dashboard_link_html}
-                </div>
-
-                <!-- Footer -->
-                <div style='background: #f7fafc; padding: 15px; text-align: center;
-                           color: #718096; font-size: 14px; border-top: 1px solid #e2e8f0;'>
-                    This is an automated alert from Service Monitor<br>
-                    <a href='{config.notifications.dashboard_base_url}'
-                       style='color: #4299e1; text-decoration: none;'>View Dashboard</a>
-                </div>
-            </div>
-        </body>
-        </html>
+        html_content = _EMAIL_TEMPLATES.get_template("email/alert.html").render(
+            subject=subject,
+            service=service,
+            emoji=emoji,
+            status_text=status_text,
+            action=action,
+            color=color,
+            check_in_time=check_in_time,
+            dashboard_url=dashboard_url,
+            dashboard_base_url=config.notifications.dashboard_base_url,
+        )
+
+        return subject, plain_text, html_content
+
+    def _generate_digest_content(
+        self, changes: Sequence[tuple[ServiceInfo, Optional[ServiceStatus]]]
+    ) -> tuple[str, str, str]:
+        """Generate email subject, plain text, and HTML content summarizing several status changes.
+
+        The wording follows the contents: an alert when every change is a problem, a recovery
+        when every change is a recovery, and a neutral status update when the digest mixes both.
         """
+        recoveries = sum(
+            previous_status in _BAD_STATES and service.status is ServiceStatus.UP
+            for service, previous_status in changes
+        )
+        if recoveries == len(changes):
+            summary = f"{len(changes)} services recovered"
+            subject = _RECOVERY_SUBJECT_PREFIX + summary
+            heading = "Service Monitor Recovery"
+        elif recoveries:
+            summary = f"{len(changes)} services changed status"
+            subject = _UPDATE_SUBJECT_PREFIX + summary
+            heading = "Service Monitor Status Update"
+        else:
+            summary = f"{len(changes)} services changed status"
+            subject = _ALERT_SUBJECT_PREFIX + summary
+            heading = "Service Monitor Alert"
+
+        plain_text = f"{heading}\n\n"
+        rows = []
+        for service, previous_status in changes:
+            previous = previous_status.value.upper() if previous_status else "NEW"
+            plain_text += f"{service.service_name}: {previous} -> {service.status.value.upper()}"
+            if service.message:
+                plain_text += f" ({service.message})"
+            plain_text += "\n"
+            rows.append((service, previous))
+
+        if config.notifications.include_dashboard_link:
+            plain_text += f"\nView Dashboard: {config.notifications.dashboard_base_url}"
+
+        html_content = _EMAIL_TEMPLATES.get_template("email/digest.html").render(
+            subject=subject,
+            summary=summary,
+            changes=rows,
+            dashboard_base_url=config.notifications.dashboard_base_url,
+        )
 
         return subject, plain_text, html_content
 
@@ -259,32 +286,76 @@ Check-ins: {service.check_in_count}
         payload = {"to": to, "subject": subject, "message": message, "html_content": html_content}
 
         for attempt in range(config.notifications.retry_attempts):
+            retry_after: Optional[float] = None
             try:
-                logger.debug(f"Sending email attempt {attempt + 1}/{config.notifications.retry_attempts} to {to}")
+                logger.debug("Sending email attempt %s/%s to %s", attempt + 1, config.notifications.retry_attempts, to)
 
-                response = await self._client.post(
-                    f"{config.notifications.gmail_api_url}/api/emails/send", json=payload
-                )
+                response = await self._client.post(self._send_url, json=payload)
 
                 if response.status_code == 200:
                     result = response.json()
                     if result.get("success"):
-                        logger.info(f"Email sent successfully to {to} - subject: {subject}")
+                        logger.info("Email sent successfully to %s - subject: %s", to, subject)
                         return True
-                    logger.error(f"Gmail API returned success=false - response: {result}")
+                    logger.error("Gmail API returned success=false - response: %s", result)
                 else:
-                    logger.error(f"Gmail API request failed - status: {response.status_code}, text: {response.text}")
-
+                    logger.error("Gmail API request failed - status: %s, text: %s", response.status_code, response.text)
+                    if response.status_code in (429, 503):
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    elif 400 <= response.status_code < 500:
+                        # The request itself was rejected; sending it again won't change that
+                        return False
+
+            except httpx.HTTPError as e:
+                # Network failures are expected and retried; a traceback adds nothing
+                logger.warning("Error sending email to %s (attempt %s): %s", to, attempt + 1, e)
             except Exception as e:
-                logger.error(f"Error sending email to {to} (attempt {attempt + 1}): {str(e)}", exc_info=True)
+                logger.error("Error sending email to %s (attempt %s): %s", to, attempt + 1, e, exc_info=True)
 
             # Wait before retry (except for last attempt)
             if attempt < config.notifications.retry_attempts - 1:
-                await asyncio.sleep(config.notifications.retry_delay_seconds)
+                await asyncio.sleep(_retry_delay(attempt, retry_after))
 
-        logger.error(f"Failed to send email to {to} after {config.notifications.retry_attempts} attempts")
+        logger.error("Failed to send email to %s after %s attempts", to, config.notifications.retry_attempts)
         return False
 
+    def _record_notification(self, service: ServiceInfo) -> None:
+        """Update notification history after a notification was sent for a service."""
+        current_time = datetime.now(timezone.utc)
+        next_allowed = time.monotonic() + config.notifications.cooldown_minutes * 60
+        self._history_json = None
+        if service.service_name in self._notification_history:
+            history = self._notification_history[service.service_name]
+            history.last_notification = current_time
+            history.last_status = service.status
+            history.notification_count += 1
+            history.next_allowed_monotonic = next_allowed
+        else:
+            self._notification_history[service.service_name] = NotificationHistory(
+                service_name=service.service_name,
+                last_notification=current_time,
+                last_status=service.status,
+                notification_count=1,
+                next_allowed_monotonic=next_allowed,
+            )
+
+    async def _send_to_recipients(self, subject: str, plain_text: str, html_content: str) -> int:
+        """Send an email to every configured recipient and return the number of successful sends.
+
+        Recipients are sent to concurrently, at most ``_MAX_CONCURRENT_SENDS`` at a time, so an alert
+        costs one round trip to the Gmail API rather than one per recipient.
+        """
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_SENDS)
+
+        async def send(recipient: str) -> bool:
+            async with limit:
+                return await self._send_email(recipient, subject, plain_text, html_content)
+
+        results = await asyncio.gather(
+            *(send(recipient) for recipient in config.notifications.recipients), return_exceptions=True
+        )
+        return sum(1 for result in results if result is True)
+
     async def send_service_notification(
         self, service: ServiceInfo, previous_status: Optional[ServiceStatus] = None
     ) -> bool:
@@ -293,38 +364,68 @@ Check-ins: {service.check_in_count}
             return False
 
         # Determine if this is a recovery notification
-        is_recovery = (
-            previous_status in [ServiceStatus.DOWN, ServiceStatus.DEGRADED] and service.status == ServiceStatus.UP
-        )
+        is_recovery = previous_status in _BAD_STATES and service.status is ServiceStatus.UP
 
-        # Generate email content
-        subject, plain_text, html_content = self._generate_email_content(service, is_recovery)
+        # Generate email content in a worker thread so rendering doesn't hold up the event loop
+        subject, plain_text, html_content = await asyncio.to_thread(self._generate_email_content, service, is_recovery)
 
         # Send to all recipients
-        success_count = 0
-        for recipient in config.notifications.recipients:
-            if await self._send_email(recipient, subject, plain_text, html_content):
-                success_count += 1
+        success_count = await self._send_to_recipients(subject, plain_text, html_content)
 
         # Update notification history
-        current_time = datetime.now(timezone.utc)
-        if service.service_name in self._notification_history:
-            history = self._notification_history[service.service_name]
-            history.last_notification = current_time
-            history.last_status = service.status
-            history.notification_count += 1
-        else:
-            self._notification_history[service.service_name] = NotificationHistory(
-                service_name=service.service_name,
-                last_notification=current_time,
-                last_status=service.status,
-                notification_count=1,
+        self._record_notification(service)
+
+        logger.info(
+            "Notification sent for %s - success: %s/%s, type: %s",
+            service.service_name,
+            success_count,
+            len(config.notifications.recipients),
+            "recovery" if is_recovery else "alert",
+        )
+
+        return success_count > 0
+
+    async def send_service_notifications_batch(
+        self, changes: Sequence[tuple[ServiceInfo, Optional[ServiceStatus]]]
+    ) -> bool:
+        """Send one digest notification covering several service status changes.
+
+        Cooldown and notification-type rules are applied per service before the digest is built,
+        so each recipient receives a single email however many services changed at once.
+
+        Args:
+            changes: List of tuples (ServiceInfo, previous_status) for services whose status changed
+
+        Returns:
+            True if the notification was delivered to at least one recipient
+        """
+        pending = [
+            (service, previous_status)
+            for service, previous_status in changes
+            if self._should_send_notification(service, previous_status)
+        ]
+        if not pending:
+            return False
+
+        if len(pending) == 1:
+            service, previous_status = pending[0]
+            is_recovery = previous_status in _BAD_STATES and service.status is ServiceStatus.UP
+            subject, plain_text, html_content = await asyncio.to_thread(
+                self._generate_email_content, service, is_recovery
             )
+        else:
+            subject, plain_text, html_content = await asyncio.to_thread(self._generate_digest_content, pending)
+
+        success_count = await self._send_to_recipients(subject, plain_text, html_content)
+
+        for service, _ in pending:
+            self._record_notification(service)
 
         logger.info(
-            f"Notification sent for {service.service_name} - "
-            f"success: {success_count}/{len(config.notifications.recipients)}, "
-            f"type: {'recovery' if is_recovery else 'alert'}"
+            "Batch notification sent - services: %s, success: %s/%s",
+            len(pending),
+            success_count,
+            len(config.notifications.recipients),
         )
 
         return success_count > 0
@@ -333,11 +434,38 @@ Check-ins: {service.check_in_count}
         """Get notification history for all services."""
         return self._notification_history.copy()
 
+    def get_notification_history_json(self) -> bytes:
+        """Get notification history for all services as a serialized JSON object.
+
+        The bytes are cached until the history next changes, so repeated reads skip serialization.
+
+        Returns:
+            JSON object mapping service names to their notification history
+        """
+        if self._history_json is None:
+            self._history_json = orjson.dumps(
+                {
+                    service_name: {
+                        "service_name": history.service_name,
+                        "last_notification": history.last_notification,
+                        "last_status": history.last_status,
+                        "notification_count": history.notification_count,
+                    }
+                    for service_name, history in self._notification_history.items()
+                }
+            )
+        return self._history_json
+
+    def get_notification_history_count(self) -> int:
+        """Get the number of services with notification history."""
+        return len(self._notification_history)
+
     def clear_notification_history(self, service_name: Optional[str] = None) -> None:
         """Clear notification history for a specific service or all services."""
+        self._history_json = None
         if service_name:
             self._notification_history.pop(service_name, None)
-            logger.info(f"Cleared notification history for {service_name}")
+            logger.info("Cleared notification history for %s", service_name)
         else:
             self._notification_history.clear()
             logger.info("Cleared all notification history")
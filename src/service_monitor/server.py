@@ -2,13 +2,27 @@
 
 import logging
 import sys
+from typing import Union
 
 import uvicorn
+from starlette.types import ASGIApp
+
+from .logs import configure_logging
 
 logger = logging.getLogger(__name__)
 
+# Import string of the application, which uvicorn needs to reload or fork workers
+APP_IMPORT_STRING = "service_monitor.main:app"
+
 
-def start_server(host: str = "0.0.0.0", port: int = 8000, log_level: str = "info", reload: bool = False) -> None:
+def start_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    log_level: str = "info",
+    reload: bool = False,
+    workers: int = 1,
+    app: Union[str, ASGIApp] = APP_IMPORT_STRING,
+) -> None:
     """Start the service monitor server.
 
     Args:
@@ -16,26 +30,58 @@ def start_server(host: str = "0.0.0.0", port: int = 8000, log_level: str = "info
         port: Port to bind the server to
         log_level: Logging level (debug, info, warning, error, critical)
         reload: Enable auto-reload for development
+        workers: Number of worker processes
+        app: Application to serve, as an import string or an already-built application
     """
+    # An already-built app is served as is; reloading and workers re-import it from a string
+    if not isinstance(app, str) and (reload or workers > 1):
+        logger.warning("Ignoring reload and workers - run `python -m service_monitor.server` to use them")
+        reload, workers = False, 1
+    # Storage, stale tracking and notification cooldowns all live in process memory, so every
+    # worker would hold its own disjoint view of the services. Keep the default of one worker
+    # unless check-ins are routed to workers by service (e.g. sticky load balancing). Behind
+    # gunicorn, run `gunicorn -k uvicorn.workers.UvicornWorker -w 1 service_monitor.main:app`.
+    if reload and workers > 1:
+        logger.warning("Ignoring workers=%s - auto-reload runs a single worker", workers)
+        workers = 1
+    if workers > 1:
+        logger.warning("Running %s workers - each worker keeps separate in-memory service state", workers)
+
     logger.info(
-        f"Starting Service Monitor server - host: {host}, port: {port}, " f"log_level: {log_level}, reload: {reload}"
+        "Starting Service Monitor server - host: %s, port: %s, log_level: %s, reload: %s, workers: %s",
+        host,
+        port,
+        log_level,
+        reload,
+        workers,
     )
 
     try:
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and falls back to
+        # asyncio and h11 otherwise. Per-request access logging is disabled as it costs a formatted
+        # log record on every poll.
         uvicorn.run(
-            "service_monitor.main:app",
+            app,
             host=host,
             port=port,
+            loop="auto",
+            http="auto",
             log_level=log_level,
+            access_log=False,
             reload=reload,
+            workers=workers,
         )
     except Exception as e:
-        logger.error(f"Failed to start server - error: {str(e)}", exc_info=True)
+        logger.error("Failed to start server - error: %s", e, exc_info=True)
         sys.exit(1)
 
 
-def main() -> None:
-    """Main entry point for the service monitor server."""
+def main(app: Union[str, ASGIApp] = APP_IMPORT_STRING) -> None:
+    """Main entry point for the service monitor server.
+
+    Args:
+        app: Application to serve, as an import string or an already-built application
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Service Monitor Server")
@@ -61,20 +107,25 @@ def main() -> None:
         action="store_true",
         help="Enable auto-reload for development",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; each keeps its own in-memory state (default: 1)",
+    )
 
     args = parser.parse_args()
 
     # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-    )
+    configure_logging(getattr(logging, args.log_level.upper()))
 
     start_server(
         host=args.host,
         port=args.port,
         log_level=args.log_level,
         reload=args.reload,
+        workers=args.workers,
+        app=app,
     )
 
 
@@ -1,25 +1,187 @@
 """Storage layer for service monitoring data."""
 
+import asyncio
+import bisect
+import contextlib
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Union
 
-from .models import ServiceInfo, ServiceStatus
+from pydantic import TypeAdapter
+
+from .models import ServiceCheckIn, ServiceInfo, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for check-in services (150 seconds = 2.5 minutes)
 DEFAULT_CHECKIN_TIMEOUT_SECONDS = 150
 
+_NS_PER_SECOND = 1_000_000_000
+
+# Shared metadata of services that never reported any. Never mutated: replaced by a dict of the
+# service's own on its first metadata update
+_NO_METADATA: dict[str, str] = {}
+
+# Status values in enum order, computed once rather than iterating the enum per request
+_STATUS_KEYS = tuple(status.value for status in ServiceStatus)
+
+_SERVICE_INFO_ADAPTER = TypeAdapter(ServiceInfo)
+
+# Statuses that go DOWN when check-ins stop; only services in these are tracked for staleness
+_STALE_CANDIDATE_STATUSES = frozenset({ServiceStatus.UP, ServiceStatus.DEGRADED})
+
+# Statuses reported by get_critical_services, in display order
+_CRITICAL_STATUSES = (ServiceStatus.DOWN, ServiceStatus.DEGRADED)
+
+
+@dataclass
+class _ServiceRecord:
+    """Mutable per-service state held by the storage.
+
+    A slotted record instead of a pydantic model: no per-instance ``__dict__`` or validation
+    on every write. Converted to ``ServiceInfo`` only when handed out of the storage.
+
+    The check-in time is kept as integer epoch nanoseconds, so writes and stale checks do
+    integer arithmetic; the ``datetime`` is built on first read after a check-in.
+    """
+
+    __slots__ = ("service_name", "status", "last_check_in_ns", "message", "metadata", "check_in_count", "_check_in_dt")
+
+    service_name: str
+    status: ServiceStatus
+    last_check_in_ns: int
+    message: Optional[str]
+    metadata: Optional[dict[str, str]]
+    check_in_count: int
+
+    def __post_init__(self) -> None:
+        """Start without a cached check-in datetime."""
+        self._check_in_dt: Optional[datetime] = None
+
+    def check_in(self, now_ns: int) -> None:
+        """Record a check-in at the given epoch nanoseconds."""
+        self.last_check_in_ns = now_ns
+        self.check_in_count += 1
+        self._check_in_dt = None
+
+    @property
+    def last_check_in(self) -> datetime:
+        """Time of the last check-in as an aware UTC datetime."""
+        if self._check_in_dt is None:
+            self._check_in_dt = datetime.fromtimestamp(self.last_check_in_ns / _NS_PER_SECOND, timezone.utc)
+        return self._check_in_dt
+
+    def to_info(self) -> ServiceInfo:
+        """Build a ServiceInfo snapshot of this record.
+
+        The record's fields were validated when they were written, so the model is built with
+        ``model_construct``, skipping validation. The metadata is copied so the snapshot does not
+        change with later updates to the record.
+        """
+        return ServiceInfo.model_construct(
+            service_name=self.service_name,
+            status=self.status,
+            last_check_in=self.last_check_in,
+            message=self.message,
+            metadata=dict(self.metadata) if self.metadata is not None else None,
+            check_in_count=self.check_in_count,
+        )
+
 
 class InMemoryStorage:
-    """In-memory storage implementation for service data."""
+    """In-memory storage implementation for service data.
+
+    Concurrency model: all mutations run on the event loop thread and consist of plain dict, list
+    and ordered-dict operations with no I/O or ``await``, so they are called inline from async handlers
+    and hold no locks; no reader on the loop can observe a half-applied update. Readers needing
+    a full copy (``get_all_services``, ``get_all_services_json``, ``get_services_by_status_json``)
+    may run in a worker thread, since they snapshot the mapping in a single C-level copy and
+    then only read records, returning copies the caller owns.
+    """
 
     def __init__(self) -> None:
         """Initialize the in-memory storage."""
-        self._services: dict[str, ServiceInfo] = {}
+        self._services: dict[str, _ServiceRecord] = {}
+        # Aggregates maintained on write so dashboards and widgets never rescan every service
+        self._status_counts: dict[str, int] = dict.fromkeys(_STATUS_KEYS, 0)
+        # Services bucketed by status so per-status queries are O(k) in the size of the bucket
+        self._by_status: dict[ServiceStatus, dict[str, _ServiceRecord]] = {status: {} for status in ServiceStatus}
+        # Names of the critical buckets kept sorted on write, so the critical list needs no per-request sort
+        self._sorted_names: dict[ServiceStatus, list[str]] = {status: [] for status in _CRITICAL_STATUSES}
+        # Last check-in time of each service that can go stale, oldest check-in first. A check-in
+        # moves its service to the end in O(1), so stale sweeps only walk expired entries at the front.
+        self._check_in_order: OrderedDict[str, int] = OrderedDict()
+        # Set when a check-in arrives with none tracked, waking a stale checker that had nothing to wait for
+        self._stale_wake: Optional[asyncio.Event] = None
+        # Bumped on every mutation; each service records the version of its last change (used for ETags)
+        self._version = 0
+        self._service_versions: dict[str, int] = {}
+        # Bumped only when a service joins, leaves or changes status, and only for the critical
+        # statuses, so status widgets keep their ETags across heartbeats
+        self._status_version = 0
+        self._critical_version = 0
+        # Serialized JSON per service, tagged with the service version it was built from
+        self._json_cache: dict[str, tuple[int, bytes]] = {}
+        # Whole listing built by get_all_services_json, tagged with the storage version it was built from
+        self._listing_json: Optional[tuple[int, bytes]] = None
         logger.info("InMemoryStorage initialized - storage_type: in_memory")
 
+    def _touch(self, service_name: str) -> None:
+        """Record a change to a service, advancing the storage version."""
+        self._version += 1
+        self._service_versions[service_name] = self._version
+
+    def _index_service(self, service: _ServiceRecord, status: ServiceStatus) -> None:
+        """Add a service to the aggregates for the given status."""
+        # str-valued members hash and compare like their values, so they index the counts without .value
+        self._status_counts[status] += 1
+        self._by_status[status][service.service_name] = service
+        self._status_version += 1
+        names = self._sorted_names.get(status)
+        if names is not None:
+            bisect.insort(names, service.service_name)
+            self._critical_version += 1
+
+    def _unindex_service(self, service_name: str, status: ServiceStatus) -> None:
+        """Remove a service from the aggregates for the given status."""
+        self._status_counts[status] -= 1
+        self._by_status[status].pop(service_name, None)
+        self._status_version += 1
+        names = self._sorted_names.get(status)
+        if names is not None:
+            index = bisect.bisect_left(names, service_name)
+            if index < len(names) and names[index] == service_name:
+                del names[index]
+            self._critical_version += 1
+
+    def _set_status(self, service: _ServiceRecord, status: ServiceStatus) -> None:
+        """Change a stored service's status, keeping the aggregates in sync."""
+        if service.status is not status:
+            self._unindex_service(service.service_name, service.status)
+            self._index_service(service, status)
+        service.status = status
+
+    def _track_check_in(self, service_name: str, status: ServiceStatus, check_in_ns: int) -> None:
+        """Move a service to the newest end of the check-in order.
+
+        Services in a status that cannot go stale are dropped from the order instead, so stale
+        sweeps never visit them.
+        """
+        order = self._check_in_order
+        if status not in _STALE_CANDIDATE_STATUSES:
+            order.pop(service_name, None)
+            return
+        was_empty = not order
+        order[service_name] = check_in_ns
+        order.move_to_end(service_name)
+        if was_empty and self._stale_wake is not None:
+            self._stale_wake.set()
+
     def update_service(
         self,
         service_name: str,
@@ -29,6 +191,9 @@ class InMemoryStorage:
     ) -> tuple[ServiceInfo, Optional[ServiceStatus]]:
         """Update or create a service entry.
 
+        Repeated check-ins with an unchanged status, message and metadata only update the
+        check-in time and count.
+
         Args:
             service_name: Name of the service
             status: Current status of the service
@@ -38,58 +203,147 @@ class InMemoryStorage:
         Returns:
             Tuple of (updated ServiceInfo object, previous status if changed)
         """
-        logger.debug(
-            f"Updating service - service_name: {service_name}, status: {status.value}, "
-            f"message: {message}, metadata_keys: {list(metadata.keys()) if metadata else []}"
-        )
+        return self._apply_check_in(service_name, status, message, metadata, time.time_ns())
+
+    def _apply_check_in(
+        self,
+        service_name: str,
+        status: ServiceStatus,
+        message: Optional[str],
+        metadata: Optional[dict[str, str]],
+        now_ns: int,
+    ) -> tuple[ServiceInfo, Optional[ServiceStatus]]:
+        """Apply one check-in received at ``now_ns`` epoch nanoseconds; see ``update_service``."""
+        service = self._services.get(service_name)
+
+        # Heartbeat fast path: nothing but the check-in time and count changes
+        if (
+            service is not None
+            and service.status is status
+            and service.message == message
+            and (not metadata or (service.metadata is not None and metadata.items() <= service.metadata.items()))
+        ):
+            service.check_in(now_ns)
+            self._track_check_in(service_name, status, now_ns)
+            self._touch(service_name)
+            return service.to_info(), None
+
+        # Read once for every log call below; Enum.value goes through a Python-level descriptor
+        status_value = status.value
+        if logger.isEnabledFor(logging.DEBUG):
+            # Guarded so the metadata key list is only built when the record is emitted
+            logger.debug(
+                "Updating service - service_name: %s, status: %s, message: %s, metadata_keys: %s",
+                service_name,
+                status_value,
+                message,
+                list(metadata.keys()) if metadata else [],
+            )
 
-        current_time = datetime.now(timezone.utc)
         previous_status: Optional[ServiceStatus] = None
 
-        if service_name in self._services:
-            service = self._services[service_name]
+        if service is not None:
             previous_status = service.status
 
             # Check if status changed
-            status_changed = previous_status != status
+            status_changed = previous_status is not status
 
-            service.status = status
-            service.last_check_in = current_time
+            self._set_status(service, status)
+            service.check_in(now_ns)
             service.message = message
-            service.check_in_count += 1
             if metadata:
-                if service.metadata is None:
-                    service.metadata = {}
-                service.metadata.update(metadata)
+                if service.metadata is None or service.metadata is _NO_METADATA:
+                    service.metadata = dict(metadata)
+                else:
+                    service.metadata.update(metadata)
 
             if status_changed:
                 logger.info(
-                    f"Service status changed - service_name: {service_name}, "
-                    f"previous: {previous_status.value}, current: {status.value}, "
-                    f"check_in_count: {service.check_in_count}"
+                    "Service status changed - service_name: %s, previous: %s, current: %s, check_in_count: %s",
+                    service_name,
+                    previous_status.value,
+                    status_value,
+                    service.check_in_count,
                 )
             else:
                 logger.debug(
-                    f"Service updated - service_name: {service_name}, status: {status.value}, "
-                    f"check_in_count: {service.check_in_count}"
+                    "Service updated - service_name: %s, status: %s, check_in_count: %s",
+                    service_name,
+                    status_value,
+                    service.check_in_count,
                 )
         else:
-            service = ServiceInfo(
+            # Interned once per service, so later lookups by the same name hit the identity fast path
+            service_name = sys.intern(service_name)
+            service = _ServiceRecord(
                 service_name=service_name,
                 status=status,
-                last_check_in=current_time,
+                last_check_in_ns=now_ns,
                 message=message,
-                metadata=metadata or {},
+                metadata=dict(metadata) if metadata else _NO_METADATA,
                 check_in_count=1,
             )
             self._services[service_name] = service
+            self._index_service(service, status)
             logger.info(
-                f"New service registered - service_name: {service_name}, status: {status.value}, "
-                f"timestamp: {current_time}"
+                "New service registered - service_name: %s, status: %s, timestamp: %s",
+                service_name,
+                status_value,
+                service.last_check_in,
             )
 
+        self._track_check_in(service_name, status, now_ns)
+        self._touch(service_name)
+
         # Return previous status only if it actually changed
-        return service, previous_status if previous_status != status else None
+        return service.to_info(), previous_status if previous_status is not status else None
+
+    def update_services_batch(
+        self, checkins: Sequence[ServiceCheckIn]
+    ) -> list[tuple[ServiceInfo, Optional[ServiceStatus]]]:
+        """Apply a batch of check-ins in order.
+
+        The whole batch shares one check-in timestamp, read once, and skips the per-item
+        ``update_service`` call.
+
+        Args:
+            checkins: Check-ins to apply
+
+        Returns:
+            List of tuples (updated ServiceInfo object, previous status if changed), one per check-in
+        """
+        now_ns = time.time_ns()
+        apply = self._apply_check_in
+        return [
+            apply(checkin.service_name, checkin.status, checkin.message, checkin.metadata, now_ns)
+            for checkin in checkins
+        ]
+
+    def apply_check_ins(
+        self, checkins: Sequence[ServiceCheckIn]
+    ) -> list[Union[tuple[ServiceInfo, Optional[ServiceStatus]], Exception]]:
+        """Apply a batch of check-ins in order, each independently of the others.
+
+        Like ``update_services_batch``, the batch shares one check-in timestamp. A check-in that
+        raises is returned as its exception in place of its result, and the check-ins after it
+        are still applied.
+
+        Args:
+            checkins: Check-ins to apply
+
+        Returns:
+            One entry per check-in: a tuple (updated ServiceInfo object, previous status if
+            changed), or the exception applying it raised
+        """
+        now_ns = time.time_ns()
+        apply = self._apply_check_in
+        results: list[Union[tuple[ServiceInfo, Optional[ServiceStatus]], Exception]] = []
+        for checkin in checkins:
+            try:
+                results.append(apply(checkin.service_name, checkin.status, checkin.message, checkin.metadata, now_ns))
+            except Exception as e:
+                results.append(e)
+        return results
 
     def get_service(self, service_name: str) -> Optional[ServiceInfo]:
         """Get information about a specific service.
@@ -101,21 +355,62 @@ class InMemoryStorage:
             ServiceInfo object if found, None otherwise
         """
         service = self._services.get(service_name)
-        if service:
-            logger.debug(f"Service retrieved - service_name: {service_name}, status: {service.status.value}")
-        else:
-            logger.warning(f"Service not found - service_name: {service_name}")
-        return service
+        if service is None:
+            # A miss is an expected outcome (the API answers 404), not a warning
+            logger.debug("Service not found - service_name: %s", service_name)
+            return None
+        return service.to_info()
 
     def get_all_services(self) -> list[ServiceInfo]:
         """Get information about all registered services.
 
+        Safe to call from a worker thread: the records are captured in a single C-level copy
+        before being converted.
+
         Returns:
             List of all ServiceInfo objects
         """
-        services = list(self._services.values())
-        logger.debug(f"All services retrieved - count: {len(services)}")
-        return services
+        return [record.to_info() for record in list(self._services.values())]
+
+    def get_all_services_json(self) -> bytes:
+        """Get all registered services serialized as a JSON array.
+
+        The whole listing is cached until the storage next changes, and each service's JSON until
+        that service next changes, so only services updated since the previous call are
+        re-serialized. Safe to call from a worker thread: cache entries are validated against the
+        version read before serializing, so a concurrent update can never leave a stale entry
+        marked current.
+
+        Returns:
+            JSON array of all services, as produced for ``list[ServiceInfo]``
+        """
+        version = self._version
+        listing = self.get_cached_all_services_json()
+        if listing is None:
+            parts = [self._service_json(name, record) for name, record in list(self._services.items())]
+            listing = b"[" + b",".join(parts) + b"]"
+            self._listing_json = (version, listing)
+        return listing
+
+    def get_cached_all_services_json(self) -> Optional[bytes]:
+        """Get the listing built by ``get_all_services_json`` if nothing changed since it was built.
+
+        Returns:
+            JSON array of all services, or None if it has to be rebuilt
+        """
+        cached = self._listing_json
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        return None
+
+    def _service_json(self, service_name: str, record: _ServiceRecord) -> bytes:
+        """Get a service's serialized JSON, re-serializing it only if it changed since it was cached."""
+        version = self._service_versions.get(service_name, -1)
+        cached = self._json_cache.get(service_name)
+        if cached is None or cached[0] != version:
+            cached = (version, _SERVICE_INFO_ADAPTER.dump_json(record.to_info()))
+            self._json_cache[service_name] = cached
+        return cached[1]
 
     def remove_service(self, service_name: str) -> bool:
         """Remove a service from monitoring.
@@ -127,12 +422,38 @@ class InMemoryStorage:
             True if service was removed, False if not found
         """
         if service_name in self._services:
-            del self._services[service_name]
-            logger.info(f"Service removed - service_name: {service_name}")
+            service = self._services.pop(service_name)
+            self._unindex_service(service_name, service.status)
+            self._check_in_order.pop(service_name, None)
+            self._service_versions.pop(service_name, None)
+            self._json_cache.pop(service_name, None)
+            self._version += 1
+            logger.info("Service removed - service_name: %s", service_name)
             return True
-        logger.warning(f"Service removal failed - service_name: {service_name} not found")
+        logger.warning("Service removal failed - service_name: %s not found", service_name)
         return False
 
+    def clear(self) -> None:
+        """Remove all services, keeping the storage version increasing so cached listings are invalidated."""
+        self._services.clear()
+        self._status_counts.update(dict.fromkeys(_STATUS_KEYS, 0))
+        for bucket in self._by_status.values():
+            bucket.clear()
+        for names in self._sorted_names.values():
+            names.clear()
+        self._check_in_order.clear()
+        self._service_versions.clear()
+        self._json_cache.clear()
+        self._listing_json = None
+        self._version += 1
+        self._status_version += 1
+        self._critical_version += 1
+        # Release any stale checker waiting on the old event; the next wait creates a fresh one
+        if self._stale_wake is not None:
+            self._stale_wake.set()
+            self._stale_wake = None
+        logger.info("All services removed")
+
     def get_services_by_status(self, status: ServiceStatus) -> list[ServiceInfo]:
         """Get all services with a specific status.
 
@@ -142,9 +463,43 @@ class InMemoryStorage:
         Returns:
             List of ServiceInfo objects with the specified status
         """
-        services = [service for service in self._services.values() if service.status == status]
-        logger.debug(f"Services filtered by status - status: {status.value}, count: {len(services)}")
-        return services
+        return [record.to_info() for record in self._by_status[status].values()]
+
+    def get_services_by_status_json(self, status: ServiceStatus) -> bytes:
+        """Get all services with a specific status serialized as a JSON array.
+
+        Reads the status bucket directly and shares the per-service JSON cache of
+        ``get_all_services_json``, so only services changed since they were last serialized
+        are converted. Safe to call from a worker thread, for the same reasons.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            JSON array of the services with the status, as produced for ``list[ServiceInfo]``
+        """
+        parts = [self._service_json(name, record) for name, record in list(self._by_status[status].items())]
+        return b"[" + b",".join(parts) + b"]"
+
+    def get_status_counts(self) -> dict[str, int]:
+        """Get the number of services in each status.
+
+        Returns:
+            Mapping of status value to the number of services with that status
+        """
+        return self._status_counts.copy()
+
+    def get_critical_services(self) -> list[ServiceInfo]:
+        """Get all DOWN and DEGRADED services.
+
+        Returns:
+            List of ServiceInfo objects, DOWN services first, each group sorted by service name
+        """
+        return [
+            self._by_status[status][name].to_info()
+            for status in _CRITICAL_STATUSES
+            for name in self._sorted_names[status]
+        ]
 
     def get_service_count(self) -> int:
         """Get the total number of monitored services.
@@ -152,9 +507,68 @@ class InMemoryStorage:
         Returns:
             Number of services being monitored
         """
-        count = len(self._services)
-        logger.debug(f"Service count retrieved - count: {count}")
-        return count
+        return len(self._services)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever any stored service changes."""
+        return self._version
+
+    @property
+    def status_version(self) -> int:
+        """Counter that changes whenever a service is added, removed or changes status.
+
+        Unlike ``version``, heartbeats that leave a service's status unchanged do not advance it.
+        """
+        return self._status_version
+
+    @property
+    def critical_version(self) -> int:
+        """Counter that changes whenever the set of DOWN and DEGRADED services or their statuses change."""
+        return self._critical_version
+
+    def get_service_version(self, service_name: str) -> Optional[int]:
+        """Get the storage version at which a service last changed.
+
+        Args:
+            service_name: Name of the service
+
+        Returns:
+            Version of the service's last change, or None if the service is not stored
+        """
+        return self._service_versions.get(service_name)
+
+    def seconds_until_next_stale(self, timeout_seconds: int = DEFAULT_CHECKIN_TIMEOUT_SECONDS) -> float:
+        """Get the time until the earliest tracked check-in exceeds the timeout.
+
+        Check-ins arriving later always expire later, so sleeping for this long never misses a stale service.
+
+        Args:
+            timeout_seconds: Number of seconds after which a service is considered stale
+
+        Returns:
+            Seconds until the next service may become stale, or the full timeout if none are tracked
+        """
+        order = self._check_in_order
+        if not order:
+            return float(timeout_seconds)
+        deadline_ns = order[next(iter(order))] + timeout_seconds * _NS_PER_SECOND
+        return max(0.0, (deadline_ns - time.time_ns()) / _NS_PER_SECOND)
+
+    async def wait_for_stale_deadline(self, timeout_seconds: int = DEFAULT_CHECKIN_TIMEOUT_SECONDS) -> None:
+        """Wait until the next service may become stale.
+
+        Sleeps until the oldest tracked check-in reaches the timeout. When no check-ins are tracked,
+        the first one to arrive wakes the waiter so its deadline can be scheduled.
+
+        Args:
+            timeout_seconds: Number of seconds after which a service is considered stale
+        """
+        if self._stale_wake is None:
+            self._stale_wake = asyncio.Event()
+        self._stale_wake.clear()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stale_wake.wait(), self.seconds_until_next_stale(timeout_seconds))
 
     def check_stale_services(
         self, timeout_seconds: int = DEFAULT_CHECKIN_TIMEOUT_SECONDS
@@ -167,33 +581,66 @@ class InMemoryStorage:
         Returns:
             List of tuples (ServiceInfo, previous_status) for services that became stale
         """
-        current_time = datetime.now(timezone.utc)
-        timeout_threshold = current_time - timedelta(seconds=timeout_seconds)
-        stale_services = []
+        stale_services = list(self.iter_stale_services(timeout_seconds))
+        if stale_services:
+            logger.info("Found %s stale services", len(stale_services))
+        return stale_services
+
+    def iter_stale_services(
+        self, timeout_seconds: int = DEFAULT_CHECKIN_TIMEOUT_SECONDS
+    ) -> Iterator[tuple[ServiceInfo, ServiceStatus]]:
+        """Mark services that haven't checked in within the timeout period as DOWN, one at a time.
+
+        The check-in order is walked from its oldest end and the walk stops at the first
+        service still within the timeout. Only UP and DEGRADED services are tracked, so the cost
+        is proportional to the number of expired services rather than the number of services.
+        Each service is marked as it is yielded, so callers handling services one by one need no
+        list of the whole sweep; consume the iterator without awaiting in between, as the sweep's
+        time is read once when it starts.
+
+        Each stale service is logged with ``service_name``, ``time_since_checkin`` and
+        ``previous_status`` as record fields, which the JSON log format writes out as keys.
+
+        Args:
+            timeout_seconds: Number of seconds after which a service is considered stale
+
+        Yields:
+            Tuples (ServiceInfo, previous_status) for services that became stale
+        """
+        now_ns = time.time_ns()
+        threshold_ns = now_ns - timeout_seconds * _NS_PER_SECOND
+        order = self._check_in_order
+        # Loop-invariant tail of the stale message
+        message_suffix = f"s (timeout: {timeout_seconds}s)"
+
+        while order:
+            service_name = next(iter(order))
+            check_in_ns = order[service_name]
+            if check_in_ns >= threshold_ns:
+                break
+            del order[service_name]
 
-        for service_name, service in self._services.items():
-            # Only check services that are currently marked as UP or DEGRADED and haven't checked in
-            if (
-                service.status in (ServiceStatus.UP, ServiceStatus.DEGRADED)
-                and service.last_check_in < timeout_threshold
-            ):
-                time_since_checkin = (current_time - service.last_check_in).total_seconds()
-                previous_status = service.status
+            service = self._services[service_name]
+
+            time_since_checkin = (now_ns - check_in_ns) // _NS_PER_SECOND
+            previous_status = service.status
 
-                # Mark service as DOWN due to timeout
-                service.status = ServiceStatus.DOWN
-                service.message = f"No check-in for {int(time_since_checkin)}s (timeout: {timeout_seconds}s)"
+            # Mark service as DOWN due to timeout
+            self._set_status(service, ServiceStatus.DOWN)
+            service.message = "No check-in for " + str(time_since_checkin) + message_suffix
+            self._touch(service_name)
 
+            if logger.isEnabledFor(logging.WARNING):
                 logger.warning(
-                    f"Service marked as stale - service_name: {service_name}, "
-                    f"last_check_in: {service.last_check_in}, "
-                    f"time_since_checkin: {int(time_since_checkin)}s, "
-                    f"previous_status: {previous_status.value}"
+                    "Service marked as stale: %s (no check-in for %ss, was %s)",
+                    service_name,
+                    time_since_checkin,
+                    previous_status.value,
+                    extra={
+                        "service_name": service_name,
+                        "time_since_checkin": time_since_checkin,
+                        "previous_status": previous_status.value,
+                    },
                 )
 
-                stale_services.append((service, previous_status))
-
-        if stale_services:
-            logger.info(f"Found {len(stale_services)} stale services")
-
-        return stale_services
+            yield service.to_info(), previous_status
@@ -0,0 +1,122 @@
+"""Tests for check-in micro-batching."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from service_monitor.batching import CheckInBatcher
+from service_monitor.models import ServiceCheckIn, ServiceStatus
+from service_monitor.storage import InMemoryStorage
+
+
+async def test_concurrent_check_ins_are_applied_in_one_batch():
+    """Test that concurrent check-ins share a batch and status changes are notified together."""
+    storage = InMemoryStorage()
+    storage.update_service("api", ServiceStatus.UP)
+    notify = AsyncMock(return_value=True)
+    batcher = CheckInBatcher(notify=notify, max_delay=0.01)
+
+    with patch.object(storage, "apply_check_ins", wraps=storage.apply_check_ins) as apply:
+        results = await asyncio.gather(
+            batcher.submit(ServiceCheckIn(service_name="api", status=ServiceStatus.DOWN), storage),
+            batcher.submit(ServiceCheckIn(service_name="worker", status=ServiceStatus.UP), storage),
+        )
+        await batcher.close()
+
+    assert [len(call.args[0]) for call in apply.call_args_list] == [2]
+    assert results[0][0].status == ServiceStatus.DOWN
+    assert results[0][1] == ServiceStatus.UP
+    assert results[1][1] is None
+    notify.assert_awaited_once_with([(results[0][0], ServiceStatus.UP)])
+
+
+async def test_full_batch_is_flushed_immediately():
+    """Test that a batch is applied as soon as it reaches the maximum size."""
+    storage = InMemoryStorage()
+    batcher = CheckInBatcher(notify=AsyncMock(), max_batch_size=2, max_delay=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.submit(ServiceCheckIn(service_name="a", status=ServiceStatus.UP), storage),
+            batcher.submit(ServiceCheckIn(service_name="b", status=ServiceStatus.UP), storage),
+        ),
+        timeout=1,
+    )
+
+    assert [service.service_name for service, _ in results] == ["a", "b"]
+    assert storage.get_service_count() == 2
+
+
+async def test_submit_many_applies_check_ins_in_one_batch():
+    """Test that a bulk submission is applied at once, together with pending check-ins."""
+    storage = InMemoryStorage()
+    batcher = CheckInBatcher(notify=AsyncMock(), max_delay=60)
+
+    with patch.object(storage, "apply_check_ins", wraps=storage.apply_check_ins) as apply:
+        pending = asyncio.ensure_future(
+            batcher.submit(ServiceCheckIn(service_name="a", status=ServiceStatus.UP), storage)
+        )
+        await asyncio.sleep(0)
+
+        results = await asyncio.wait_for(
+            batcher.submit_many(
+                [
+                    ServiceCheckIn(service_name="b", status=ServiceStatus.UP),
+                    ServiceCheckIn(service_name="a", status=ServiceStatus.DOWN),
+                ],
+                storage,
+            ),
+            timeout=1,
+        )
+
+    assert [len(call.args[0]) for call in apply.call_args_list] == [3]
+    assert (await pending)[0].status == ServiceStatus.UP
+    assert [(service.service_name, previous) for service, previous in results] == [
+        ("b", None),
+        ("a", ServiceStatus.UP),
+    ]
+    assert results[0][0].last_check_in == results[1][0].last_check_in
+
+
+async def test_check_ins_are_applied_to_the_storage_they_were_submitted_with():
+    """Test that one batch holding check-ins for two storages updates each storage with its own."""
+    first, second = InMemoryStorage(), InMemoryStorage()
+    batcher = CheckInBatcher(notify=AsyncMock(), max_delay=0.01)
+
+    await asyncio.gather(
+        batcher.submit(ServiceCheckIn(service_name="a", status=ServiceStatus.UP), first),
+        batcher.submit(ServiceCheckIn(service_name="b", status=ServiceStatus.UP), second),
+        batcher.submit(ServiceCheckIn(service_name="c", status=ServiceStatus.UP), first),
+    )
+
+    assert [service.service_name for service in first.get_all_services()] == ["a", "c"]
+    assert [service.service_name for service in second.get_all_services()] == ["b"]
+
+
+async def test_failed_check_in_fails_only_its_caller():
+    """Test that a check-in failing mid-batch leaves the others applied and their changes notified."""
+    storage = InMemoryStorage()
+    storage.update_service("api", ServiceStatus.UP)
+    notify = AsyncMock(return_value=True)
+    batcher = CheckInBatcher(notify=notify, max_delay=0.01)
+    apply_check_in = storage._apply_check_in
+
+    def failing_apply(service_name, *args):
+        if service_name == "bad":
+            msg = "cannot apply check-in"
+            raise RuntimeError(msg)
+        return apply_check_in(service_name, *args)
+
+    with patch.object(storage, "_apply_check_in", failing_apply):
+        results = await asyncio.gather(
+            batcher.submit(ServiceCheckIn(service_name="api", status=ServiceStatus.DOWN), storage),
+            batcher.submit(ServiceCheckIn(service_name="bad", status=ServiceStatus.UP), storage),
+            batcher.submit(ServiceCheckIn(service_name="worker", status=ServiceStatus.UP), storage),
+            return_exceptions=True,
+        )
+        await batcher.close()
+
+    assert isinstance(results[1], RuntimeError)
+    assert results[0][1] == ServiceStatus.UP
+    assert results[2][0].service_name == "worker"
+    assert [service.service_name for service in storage.get_all_services()] == ["api", "worker"]
+    notify.assert_awaited_once_with([(results[0][0], ServiceStatus.UP)])
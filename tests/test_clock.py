@@ -0,0 +1,27 @@
+"""Tests for cached clock helpers."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from service_monitor.clock import utc_now_seconds, utc_now_seconds_iso
+
+
+def test_utc_now_seconds_is_cached_per_second():
+    """Test that the timestamp is truncated to the second and rebuilt only when the second changes."""
+    with patch("service_monitor.clock.time.time", return_value=1_700_000_000.25):
+        first = utc_now_seconds()
+    with patch("service_monitor.clock.time.time", return_value=1_700_000_000.75):
+        second = utc_now_seconds()
+    with patch("service_monitor.clock.time.time", return_value=1_700_000_001.1):
+        third = utc_now_seconds()
+
+    assert first == datetime.fromtimestamp(1_700_000_000, timezone.utc)
+    assert second is first
+    assert third == datetime.fromtimestamp(1_700_000_001, timezone.utc)
+
+
+def test_utc_now_seconds_iso_matches_cached_datetime():
+    """Test that the ISO text is that of the cached datetime for the same second."""
+    with patch("service_monitor.clock.time.time", return_value=1_700_000_100.5):
+        assert utc_now_seconds_iso() == "2023-11-14T22:15:00+00:00"
+        assert utc_now_seconds_iso() == utc_now_seconds().isoformat()
@@ -0,0 +1,57 @@
+"""Tests for logging configuration."""
+
+import json
+import logging
+
+from service_monitor.logs import JSONFormatter, RequestIdMiddleware, request_id_var
+
+
+def test_json_formatter_includes_request_id():
+    """Test that JSON records carry the raw timestamp, message and current request id."""
+    record = logging.LogRecord("service_monitor.test", logging.INFO, __file__, 1, "checked %s", ("api",), None)
+
+    token = request_id_var.set("abc123")
+    try:
+        entry = json.loads(JSONFormatter().format(record))
+    finally:
+        request_id_var.reset(token)
+
+    assert entry == {
+        "t": record.created,
+        "lvl": "INFO",
+        "logger": "service_monitor.test",
+        "msg": "checked api",
+        "req_id": "abc123",
+    }
+
+
+async def test_request_id_middleware_sets_id_per_request():
+    """Test that each HTTP request gets its own id, cleared once the request finishes."""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(request_id_var.get())
+
+    middleware = RequestIdMiddleware(app)
+    await middleware({"type": "http"}, None, None)
+    await middleware({"type": "http"}, None, None)
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert seen[0] is not None
+    assert seen[1] not in (None, seen[0])
+    assert seen[2] is None
+    assert request_id_var.get() is None
+
+
+def test_json_formatter_writes_extra_fields():
+    """Test that fields passed with ``extra=`` become keys of the JSON record."""
+    record = logging.makeLogRecord(
+        {"name": "service_monitor.test", "msg": "stale", "service_name": "api", "time_since_checkin": 400}
+    )
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["service_name"] == "api"
+    assert entry["time_since_checkin"] == 400
+    assert "args" not in entry
+    assert "levelno" not in entry
@@ -3,7 +3,9 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from service_monitor.main import app, reset_storage
+from service_monitor.main import app, get_storage, reset_storage
+from service_monitor.models import ServiceStatus
+from service_monitor.storage import InMemoryStorage
 
 
 @pytest.fixture
@@ -48,13 +50,33 @@ def test_service_checkin_success(client):
     assert "last_check_in" in data
 
 
+def test_service_checkin_bulk(client):
+    """Test applying several check-ins in one request."""
+    checkins = [
+        {"service_name": "bulk-api", "status": "up"},
+        {"service_name": "bulk-worker", "status": "degraded", "message": "Queue backlog"},
+        {"service_name": "bulk-api", "status": "up"},
+    ]
+
+    response = client.post("/services/checkin/bulk", json=checkins)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert [(service["service_name"], service["check_in_count"]) for service in data] == [
+        ("bulk-api", 1),
+        ("bulk-worker", 1),
+        ("bulk-api", 2),
+    ]
+    assert client.get("/services/bulk-worker").json()["message"] == "Queue backlog"
+
+
 def test_service_checkin_empty_name(client):
     """Test service check-in with empty service name."""
     checkin_data = {"service_name": "", "status": "up"}
 
     response = client.post("/services/checkin", json=checkin_data)
-    assert response.status_code == 400
-    assert "Service name cannot be empty" in response.json()["detail"]
+    assert response.status_code == 422
+    assert "Service name cannot be empty" in response.json()["detail"][0]["msg"]
 
 
 def test_service_checkin_whitespace_name(client):
@@ -62,7 +84,7 @@ def test_service_checkin_whitespace_name(client):
     checkin_data = {"service_name": "   ", "status": "up"}
 
     response = client.post("/services/checkin", json=checkin_data)
-    assert response.status_code == 400
+    assert response.status_code == 422
 
 
 def test_multiple_checkins_same_service(client):
@@ -117,6 +139,18 @@ def test_get_all_services_with_data(client):
     assert "service-3" in service_names
 
 
+def test_get_all_services_reflects_changes(client):
+    """Test that the cached service list is rebuilt after every change."""
+    client.post("/services/checkin", json={"service_name": "service-1", "status": "up"})
+    assert [s["status"] for s in client.get("/services").json()] == ["up"]
+
+    client.post("/services/checkin", json={"service_name": "service-1", "status": "down"})
+    assert [s["status"] for s in client.get("/services").json()] == ["down"]
+
+    client.delete("/services/service-1")
+    assert client.get("/services").json() == []
+
+
 def test_get_specific_service_success(client):
     """Test getting a specific service that exists."""
     # First, add a service
@@ -220,3 +254,109 @@ def test_invalid_service_status(client):
 
     response = client.post("/services/checkin", json=checkin_data)
     assert response.status_code == 422  # Pydantic validation error
+
+
+def test_widget_links_use_request_base_url(client):
+    """Test that widget links point back at the host the widget was requested from."""
+    client.post("/services/checkin", json={"service_name": "web", "status": "down"})
+
+    response = client.get("/widgets/service/web")
+    assert response.status_code == 200
+    assert "http://testserver/service/web" in response.text
+
+    response = client.get("/widgets/summary", headers={"host": "monitor.example.com"})
+    assert response.status_code == 200
+    assert "http://monitor.example.com" in response.text
+
+
+def test_conditional_get_returns_not_modified(client):
+    """Test that unchanged resources are answered with 304 and changes issue a new ETag."""
+    client.post("/services/checkin", json={"service_name": "web", "status": "up"})
+
+    paths = (
+        "/services",
+        "/services/web",
+        "/services/status/up",
+        "/widgets/summary",
+        "/widgets/critical",
+        "/widgets/service/web",
+    )
+    for path in paths:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "max-age=1, must-revalidate"
+        etag = response.headers["etag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    widget_etags = {path: client.get(path).headers["etag"] for path in ("/widgets/summary", "/widgets/critical")}
+    # A heartbeat from an UP service changes neither the status counts nor the critical list
+    client.post("/services/checkin", json={"service_name": "web", "status": "up"})
+    for path, widget_etag in widget_etags.items():
+        assert client.get(path, headers={"If-None-Match": widget_etag}).status_code == 304
+
+    etag = client.get("/services/web").headers["etag"]
+    client.post("/services/checkin", json={"service_name": "web", "status": "down"})
+    response = client.get("/services/web", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    for path, widget_etag in widget_etags.items():
+        assert client.get(path, headers={"If-None-Match": widget_etag}).status_code == 200
+
+
+def test_storage_dependency_can_be_overridden(client):
+    """Test that handlers read storage through the injectable get_storage dependency."""
+    injected = InMemoryStorage()
+    injected.update_service("injected-service", ServiceStatus.UP)
+    app.dependency_overrides[get_storage] = lambda: injected
+    try:
+        response = client.get("/services/injected-service")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["service_name"] == "injected-service"
+
+
+def test_service_listing_is_cached_per_storage(client):
+    """Test that two storages at the same version each list their own services."""
+    client.post("/services/checkin", json={"service_name": "default-service", "status": "up"})
+    assert [service["service_name"] for service in client.get("/services").json()] == ["default-service"]
+
+    injected = InMemoryStorage()
+    injected.update_service("injected-service", ServiceStatus.UP)
+    app.dependency_overrides[get_storage] = lambda: injected
+    try:
+        response = client.get("/services")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [service["service_name"] for service in response.json()] == ["injected-service"]
+
+
+def test_check_ins_use_the_storage_dependency(client):
+    """Test that check-ins are written to an overriding storage, not the module's default one."""
+    injected = InMemoryStorage()
+    app.dependency_overrides[get_storage] = lambda: injected
+    try:
+        assert client.post("/services/checkin", json={"service_name": "a", "status": "up"}).status_code == 201
+        bulk = client.post("/services/checkin/bulk", json=[{"service_name": "b", "status": "up"}])
+        assert bulk.status_code == 201
+        assert client.get("/services/a").status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+    assert injected.get_service_count() == 2
+    assert client.get("/services/a").status_code == 404
+
+
+def test_dashboard_renders_services(client):
+    """Test that the streamed dashboard lists registered services."""
+    client.post("/services/checkin", json={"service_name": "dashboard-service", "status": "up"})
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "dashboard-service" in response.text
@@ -42,6 +42,14 @@ def test_service_checkin_minimal():
     assert checkin.metadata == {}
 
 
+def test_service_checkin_interns_service_name():
+    """Test that check-ins parsed from separate request bodies share one service name object."""
+    first = ServiceCheckIn.model_validate_json('{"service_name": "interned-service", "status": "up"}')
+    second = ServiceCheckIn.model_validate_json('{"service_name": "interned-service", "status": "down"}')
+
+    assert first.service_name is second.service_name
+
+
 def test_service_checkin_invalid_status():
     """Test ServiceCheckIn with invalid status."""
     with pytest.raises(ValidationError) as exc_info:
@@ -52,10 +60,15 @@ def test_service_checkin_invalid_status():
     assert "status" in errors[0]["loc"]
 
 
-def test_service_checkin_empty_service_name():
-    """Test ServiceCheckIn allows empty service name (validation happens at API level)."""
-    checkin = ServiceCheckIn(service_name="", status=ServiceStatus.UP)
-    assert checkin.service_name == ""
+@pytest.mark.parametrize("service_name", ["", "   "])
+def test_service_checkin_blank_service_name(service_name):
+    """Test ServiceCheckIn rejects empty and whitespace-only service names."""
+    with pytest.raises(ValidationError) as exc_info:
+        ServiceCheckIn(service_name=service_name, status=ServiceStatus.UP)
+
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["loc"] == ("service_name",)
 
 
 def test_service_info_creation():
@@ -0,0 +1,345 @@
+"""Tests for monitored service health checking."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from service_monitor.models import ServiceStatus
+from service_monitor.monitored_services import MonitoredService, MonitoredServiceManager, _cancel_and_wait
+from service_monitor.storage import InMemoryStorage
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """Create a monitored service manager backed by a temporary config file."""
+    manager = MonitoredServiceManager(config_file=str(tmp_path / "monitored_services.json"))
+    yield manager
+    await manager.close()
+
+
+async def test_health_checks_share_one_client(manager):
+    """Test that every health check goes through the manager's shared client."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = manager._client
+    service = MonitoredService(name="api", health_url="http://api.test/health")
+
+    for _ in range(2):
+        status, _, metadata = await manager.check_service_health(service, use_cache=False)
+        assert status == ServiceStatus.UP
+        assert metadata["http_status_code"] == "200"
+
+    assert len(requests) == 2
+    assert manager._client is client
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected_status"),
+    [([b"status: he", b"althy"], ServiceStatus.UP), ([b"status: down"], ServiceStatus.DEGRADED)],
+)
+async def test_body_check_scans_streamed_chunks(manager, chunks, expected_status):
+    """Test that expected content is found in a streamed body, including across chunk boundaries."""
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    )
+    service = MonitoredService(
+        name="api", health_url="http://api.test/health", check_response_body=True, expected_body_content="healthy"
+    )
+
+    status, _, metadata = await manager.check_service_health(service)
+
+    assert status == expected_status
+    assert "response_time_ms" in metadata
+
+
+async def test_health_checks_are_limited_per_origin(manager):
+    """Test that services on the same origin share a concurrency limit and other origins do not."""
+    gateway = manager._origin_limit("https://gateway.test/api/health")
+
+    assert manager._origin_limit("https://gateway.test/worker/health?full=1") is gateway
+    assert manager._origin_limit("https://gateway.test:8443/health") is not gateway
+    assert manager._origin_limit("http://gateway.test/health") is not gateway
+
+
+async def test_config_changes_are_saved_and_reloaded(manager):
+    """Test that added and removed services are written to the config file and loaded back."""
+    await manager.add_service(MonitoredService(name="api", health_url="http://api.test/health"))
+    await manager.add_service(MonitoredService(name="worker", health_url="http://worker.test/health"))
+    assert await manager.remove_service("worker")
+    assert not await manager.remove_service("worker")
+
+    reloaded = MonitoredServiceManager(config_file=str(manager.config_file))
+    try:
+        assert list(reloaded.services) == ["api"]
+        assert reloaded.services["api"] == manager.services["api"]
+        assert not manager.config_file.with_name(manager.config_file.name + ".tmp").exists()
+    finally:
+        await reloaded.close()
+
+
+async def test_bulk_changes_write_config_once(manager):
+    """Test that bulk updates, bulk removals and deferred_save blocks each write the config file once."""
+    writes = []
+    write_config = manager._write_config
+    manager._write_config = lambda payload: (writes.append(payload), write_config(payload))
+
+    await manager.bulk_update(
+        MonitoredService(name=name, health_url=f"http://{name}.test/health") for name in ("api", "worker", "cron")
+    )
+    assert len(writes) == 1
+
+    assert await manager.bulk_remove(["worker", "missing", "cron"]) == ["worker", "cron"]
+    assert len(writes) == 2
+
+    async with manager.deferred_save():
+        async with manager.deferred_save():
+            await manager.add_service(MonitoredService(name="worker", health_url="http://worker.test/health"))
+        await manager.remove_service("api")
+        assert len(writes) == 2
+    assert len(writes) == 3
+
+    reloaded = MonitoredServiceManager(config_file=str(manager.config_file))
+    try:
+        assert list(reloaded.services) == ["worker"]
+    finally:
+        await reloaded.close()
+
+
+async def test_open_recreates_closed_client(manager):
+    """Test that the shared HTTP client is reused while open and recreated after close."""
+    client = manager._client
+    await manager.open()
+    assert manager._client is client
+
+    await manager.close()
+    await manager.open()
+    assert manager._client is not client
+    assert not manager._client.is_closed
+
+
+async def test_due_health_checks_run_concurrently(manager):
+    """Test that due services are checked together and each is rescheduled after its interval."""
+    running = 0
+    both_running = asyncio.Event()
+    release = asyncio.Event()
+
+    async def check_service_health(service, use_cache=True):
+        nonlocal running
+        running += 1
+        if running == 2:
+            both_running.set()
+        await release.wait()
+        return ServiceStatus.UP, "ok", {}
+
+    manager.check_service_health = check_service_health
+    for name in ("api", "worker"):
+        manager.services[name] = MonitoredService(name=name, health_url=f"http://{name}.test/health")
+    storage = InMemoryStorage()
+
+    await manager.start_monitoring(storage)
+    # Neither check can finish until both have started, so this only returns if they overlap
+    await asyncio.wait_for(both_running.wait(), timeout=5)
+    checks = list(manager._check_tasks.values())
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*checks), timeout=5)
+
+    assert storage.get_service_count() == 2
+    assert all(service.check_in_count == 1 for service in storage.get_all_services())
+    loop_time = asyncio.get_running_loop().time()
+    assert all(due_at > loop_time + 50 for due_at in manager._next_due.values())
+
+
+async def test_slow_check_does_not_delay_other_services(manager):
+    """Test that a fast service keeps its cadence while another service's check is still running."""
+    checks = {"fast": 0, "slow": 0}
+    fifth_fast_check = asyncio.Event()
+    never = asyncio.Event()
+
+    async def check_service_health(service, use_cache=True):
+        checks[service.name] += 1
+        # The slow check never finishes, and the fifth fast check holds so the counts stay put
+        if service.name == "fast" and checks["fast"] == 5:
+            fifth_fast_check.set()
+            await never.wait()
+        if service.name == "slow":
+            await never.wait()
+        return ServiceStatus.UP, "ok", {}
+
+    manager.check_service_health = check_service_health
+    manager.services["fast"] = MonitoredService(name="fast", health_url="http://fast.test/health")
+    manager.services["slow"] = MonitoredService(name="slow", health_url="http://slow.test/health")
+    manager.services["fast"].check_interval_seconds = 0.01
+    storage = InMemoryStorage()
+
+    await manager.start_monitoring(storage)
+    await asyncio.wait_for(fifth_fast_check.wait(), timeout=5)
+
+    assert checks == {"fast": 5, "slow": 1}
+    assert storage.get_service("fast").check_in_count == 4
+    assert storage.get_service("slow") is None
+
+    await manager.stop_monitoring()
+    assert manager._check_tasks == {}
+
+
+async def test_stopped_service_result_is_dropped(manager):
+    """Test that a check still in flight when its service is stopped does not update storage."""
+    started = asyncio.Event()
+
+    async def check_service_health(service, use_cache=True):
+        started.set()
+        await asyncio.sleep(0.05)
+        return ServiceStatus.UP, "ok", {}
+
+    manager.check_service_health = check_service_health
+    manager.services["api"] = MonitoredService(name="api", health_url="http://api.test/health")
+    storage = InMemoryStorage()
+
+    await manager.start_monitoring(storage)
+    await started.wait()
+    await manager.stop_monitoring("api")
+    await asyncio.sleep(0.1)
+
+    assert storage.get_service("api") is None
+    assert "api" not in manager._next_due
+
+
+async def test_health_check_results_are_shared_and_cached(manager):
+    """Test that concurrent callers share one probe and a fresh result is reused unless bypassed."""
+    probes = 0
+
+    async def probe_health(service):
+        nonlocal probes
+        probes += 1
+        await asyncio.sleep(0.01)
+        return ServiceStatus.UP, f"probe {probes}", {}
+
+    manager._probe_health = probe_health
+    service = MonitoredService(name="api", health_url="http://api.test/health")
+
+    first, second = await asyncio.gather(manager.check_service_health(service), manager.check_service_health(service))
+    assert first == second == (ServiceStatus.UP, "probe 1", {})
+    assert (await manager.check_service_health(service))[1] == "probe 1"
+    assert (await manager.check_service_health(service, use_cache=False))[1] == "probe 2"
+
+    # A changed configuration is never answered from the old configuration's result
+    updated = service.model_copy(update={"timeout_seconds": 5})
+    assert (await manager.check_service_health(updated))[1] == "probe 3"
+
+
+async def test_pop_due_skips_stale_and_removed_entries(manager):
+    """Test that only live deadlines at or before now are popped from the schedule."""
+    for name in ("api", "worker", "cron", "later"):
+        manager.services[name] = MonitoredService(name=name, health_url=f"http://{name}.test/health")
+    manager._schedule("api", 1.0)
+    manager._schedule("worker", 2.0)
+    manager._schedule("worker", 3.0)  # rescheduled, superseding the entry at 2.0
+    manager._schedule("cron", 1.5)
+    manager._schedule("later", 50.0)
+    del manager.services["cron"]
+
+    due = manager._pop_due(now=10.0)
+
+    assert [(service.name, due_at) for service, due_at in due] == [("api", 1.0), ("worker", 3.0)]
+    assert "cron" not in manager._next_due
+    assert manager._due_heap[0] == (50.0, "later")
+
+
+async def test_status_only_checks_use_head_with_get_fallback(manager):
+    """Test that status-only checks probe with HEAD and switch to GET for servers rejecting it."""
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        if request.method == "HEAD" and request.url.host == "legacy.test":
+            return httpx.Response(405, stream=httpx.ByteStream(b""))
+        return httpx.Response(200, stream=httpx.ByteStream(b""))
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    modern = MonitoredService(name="modern", health_url="http://modern.test/health")
+    legacy = MonitoredService(name="legacy", health_url="http://legacy.test/health")
+
+    assert (await manager.check_service_health(modern))[0] == ServiceStatus.UP
+    assert methods == ["HEAD"]
+
+    methods.clear()
+    assert (await manager.check_service_health(legacy))[0] == ServiceStatus.UP
+    assert (await manager.check_service_health(legacy, use_cache=False))[0] == ServiceStatus.UP
+    assert methods == ["HEAD", "GET", "GET"]
+
+
+async def test_next_deadline_keeps_cadence_and_resyncs_when_far_behind(manager):
+    """Test that deadlines advance from the previous deadline unless more than an interval behind."""
+    service = MonitoredService(name="api", health_url="http://api.test/health", check_interval_seconds=60)
+    now = asyncio.get_running_loop().time()
+
+    # A slow check does not push the next deadline back
+    assert manager._next_deadline(service, now - 5) == now + 55
+    # Slightly late checks catch up on the original cadence
+    assert manager._next_deadline(service, now - 90) == now - 30
+    # Falling several intervals behind resyncs to one interval from now
+    assert manager._next_deadline(service, now - 200) >= now + 60
+
+
+async def test_cancel_and_wait_does_not_hang_on_stuck_tasks():
+    """Test that shutdown gives up on a task that ignores cancellation after the timeout."""
+    release = asyncio.Event()
+
+    async def stubborn():
+        while not release.is_set():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                continue
+
+    cooperative = asyncio.ensure_future(asyncio.sleep(10))
+    stuck = asyncio.ensure_future(stubborn())
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(_cancel_and_wait([cooperative, stuck], timeout=0.05), timeout=1)
+
+    assert cooperative.cancelled()
+    assert not stuck.done()
+    release.set()
+    stuck.cancel()
+    await stuck
+
+
+async def test_removed_and_replaced_services_forget_probe_results(manager):
+    """Test that cached results and HEAD fallbacks are dropped when a service's config goes away."""
+
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405, stream=httpx.ByteStream(b""))
+        return httpx.Response(200, stream=httpx.ByteStream(b""))
+
+    await manager._client.aclose()
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    legacy = MonitoredService(name="legacy", health_url="http://legacy.test/health")
+    await manager.add_service(legacy)
+    await manager.check_service_health(legacy)
+    assert "legacy" in manager._result_cache
+    assert legacy.health_url in manager._head_unsupported
+
+    await manager.add_service(legacy.model_copy(update={"health_url": "http://legacy.test/v2/health"}))
+    assert "legacy" not in manager._result_cache
+    assert legacy.health_url not in manager._head_unsupported
+
+    await manager.check_service_health(manager.services["legacy"])
+    assert await manager.bulk_remove(["legacy"]) == ["legacy"]
+    assert manager._result_cache == {}
+    assert manager._head_unsupported == set()
@@ -1,21 +1,37 @@
 """Tests for the notification system."""
 
+import asyncio
+import json
+import re
+import time
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
+from service_monitor.config import NotificationConfig, ServiceMonitorConfig
 from service_monitor.models import ServiceInfo, ServiceStatus
-from service_monitor.notifications import EmailNotificationService, NotificationHistory
+from service_monitor.notifications import EmailNotificationService, NotificationHistory, _retry_delay
 
+# Fixed time for the check-ins and notification history built in these tests
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest.fixture
+# Status labels as the email bodies show them
+_STATUS_UPPER = {status: status.value.upper() for status in ServiceStatus}
+
+# Response of an accepted send, as far as the service reads it
+_FAKE_OK_RESPONSE = SimpleNamespace(status_code=200, json=lambda: {"success": True})
+
+
+@pytest.fixture(scope="module")
 def service_info():
-    """Create a test service info."""
+    """Create a test service info shared by the tests in this module, which only read it."""
     return ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.DOWN,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         message="Test service is down",
         metadata={"version": "1.0.0"},
         check_in_count=1,
@@ -23,65 +39,87 @@ def service_info():
 
 
 @pytest.fixture
-def notification_service():
-    """Create a notification service instance."""
-    with patch("service_monitor.config.config") as mock_config:
-        mock_config.notifications.enabled = True
-        mock_config.notifications.recipients = ["test@example.com"]
-        mock_config.notifications.cooldown_minutes = 60
-        service = EmailNotificationService()
-        yield service
+def make_history(service_info):
+    """Create notification history for the test service, with its cooldown still running."""
+
+    def factory(**overrides):
+        fields = {
+            "service_name": service_info.service_name,
+            "last_notification": FROZEN_NOW,
+            "last_status": service_info.status,
+            "notification_count": 1,
+            "next_allowed_monotonic": time.monotonic() + 3600,
+        }
+        fields.update(overrides)
+        return NotificationHistory(**fields)
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def fake_config():
+    """Create a real configuration with notifications going to a test recipient."""
+    return ServiceMonitorConfig(
+        notifications=NotificationConfig(enabled=True, recipients=["test@example.com"], cooldown_minutes=60)
+    )
 
 
-def test_notification_service_init(notification_service):
-    """Test notification service initialization."""
-    assert notification_service._notification_history == {}
-    assert notification_service._client is not None
+@pytest.fixture(scope="module", autouse=True)
+def _use_fake_config(fake_config):
+    """Point the notification module at the test configuration while this module's tests run."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("service_monitor.notifications.config", fake_config)
+        yield
 
 
-def test_should_send_notification_disabled():
-    """Test that notifications are not sent when disabled."""
-    with patch("service_monitor.notifications.config") as mock_config:
-        mock_config.notifications.enabled = False
-        service = EmailNotificationService()
+@pytest.fixture(scope="module")
+def notification_service(_use_fake_config):
+    """Create one notification service instance shared by the tests in this module, closing its client after."""
+    service = EmailNotificationService()
+    yield service
+    asyncio.run(service.close())
 
-        test_service = ServiceInfo(
-            service_name="test",
-            status=ServiceStatus.DOWN,
-            last_check_in=datetime.now(timezone.utc),
-            check_in_count=1,
-        )
 
-        assert not service._should_send_notification(test_service)
+@pytest.fixture(autouse=True)
+def _reset_notification_history(notification_service):
+    """Forget the shared service's notification history after each test."""
+    yield
+    notification_service._notification_history.clear()
+    notification_service._history_json = None
 
 
-def test_should_send_notification_for_down_service(notification_service, service_info):
-    """Test that notifications are sent for DOWN services."""
-    assert notification_service._should_send_notification(service_info)
+def test_notification_service_init(notification_service):
+    """Test notification service initialization."""
+    assert notification_service._notification_history == {}
+    assert notification_service._client is not None
 
 
-def test_should_send_notification_for_degraded_service(notification_service):
-    """Test that notifications are sent for DEGRADED services."""
-    service_info = ServiceInfo(
-        service_name="test-service",
-        status=ServiceStatus.DEGRADED,
-        last_check_in=datetime.now(timezone.utc),
+def test_should_send_notification_disabled(notification_service, fake_config, monkeypatch):
+    """Test that notifications are not sent when disabled."""
+    monkeypatch.setattr(fake_config.notifications, "enabled", False)
+    test_service = ServiceInfo(
+        service_name="test",
+        status=ServiceStatus.DOWN,
+        last_check_in=FROZEN_NOW,
         check_in_count=1,
     )
 
-    assert notification_service._should_send_notification(service_info)
+    assert not notification_service._should_send_notification(test_service)
 
 
-def test_should_not_send_notification_for_up_service(notification_service):
-    """Test that notifications are not sent for UP services without previous status."""
+@pytest.mark.parametrize(
+    ("status", "expected"), [(ServiceStatus.DOWN, True), (ServiceStatus.DEGRADED, True), (ServiceStatus.UP, False)]
+)
+def test_should_send_notification_by_status(notification_service, status, expected):
+    """Test that DOWN and DEGRADED services are notified and UP services without a previous status are not."""
     service_info = ServiceInfo(
         service_name="test-service",
-        status=ServiceStatus.UP,
-        last_check_in=datetime.now(timezone.utc),
+        status=status,
+        last_check_in=FROZEN_NOW,
         check_in_count=1,
     )
 
-    assert not notification_service._should_send_notification(service_info)
+    assert notification_service._should_send_notification(service_info) is expected
 
 
 def test_generate_email_content_alert(notification_service, service_info):
@@ -90,8 +128,9 @@ def test_generate_email_content_alert(notification_service, service_info):
 
     assert "Service Alert" in subject
     assert service_info.service_name in subject
-    assert service_info.service_name in plain_text
-    assert service_info.status.value.upper() in plain_text
+    # The body names the service, then its status
+    status_line = re.compile(rf"{re.escape(service_info.service_name)}.*{_STATUS_UPPER[service_info.status]}", re.S)
+    assert status_line.search(plain_text)
     assert service_info.service_name in html_content
 
 
@@ -100,7 +139,7 @@ def test_generate_email_content_recovery(notification_service):
     service_info = ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.UP,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         check_in_count=2,
     )
 
@@ -111,74 +150,150 @@ def test_generate_email_content_recovery(notification_service):
     assert service_info.service_name in html_content
 
 
-def test_notification_history_tracking(notification_service, service_info):
+def test_generate_email_content_escapes_html(notification_service):
+    """Test that service-provided text is HTML-escaped in the email body."""
+    service_info = ServiceInfo(
+        service_name="api",
+        status=ServiceStatus.DOWN,
+        last_check_in=FROZEN_NOW,
+        message="<script>alert(1)</script>",
+        metadata={"region": "us & eu"},
+    )
+
+    _, plain_text, html_content = notification_service._generate_email_content(service_info)
+
+    assert "<script>" not in html_content
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html_content
+    assert "us &amp; eu" in html_content
+    assert "<script>alert(1)</script>" in plain_text
+
+
+def test_notification_history_tracking(notification_service, service_info, make_history):
     """Test that notification history is properly tracked."""
     # Initially empty
     assert len(notification_service._notification_history) == 0
 
     # After tracking a notification
-    notification_service._notification_history[service_info.service_name] = NotificationHistory(
-        service_name=service_info.service_name,
-        last_notification=datetime.now(timezone.utc),
-        last_status=service_info.status,
-        notification_count=1,
-    )
+    notification_service._notification_history[service_info.service_name] = make_history()
 
     history = notification_service.get_notification_history()
     assert len(history) == 1
     assert service_info.service_name in history
 
 
-def test_clear_notification_history(notification_service, service_info):
+def test_notification_history_json_tracks_changes(notification_service, service_info):
+    """Test that the serialized history is rebuilt after notifications are recorded or cleared."""
+    assert json.loads(notification_service.get_notification_history_json()) == {}
+
+    notification_service._record_notification(service_info)
+    history = json.loads(notification_service.get_notification_history_json())
+    assert history[service_info.service_name]["notification_count"] == 1
+    assert history[service_info.service_name]["last_status"] == service_info.status.value
+
+    notification_service._record_notification(service_info)
+    history = json.loads(notification_service.get_notification_history_json())
+    assert history[service_info.service_name]["notification_count"] == 2
+
+    notification_service.clear_notification_history()
+    assert json.loads(notification_service.get_notification_history_json()) == {}
+
+
+def test_clear_notification_history(notification_service, service_info, make_history):
     """Test clearing notification history."""
     # Add some history
-    notification_service._notification_history[service_info.service_name] = NotificationHistory(
-        service_name=service_info.service_name,
-        last_notification=datetime.now(timezone.utc),
-        last_status=service_info.status,
-        notification_count=1,
-    )
+    notification_service._notification_history[service_info.service_name] = make_history()
 
     # Clear specific service
     notification_service.clear_notification_history(service_info.service_name)
     assert len(notification_service._notification_history) == 0
 
     # Add history again and clear all
-    notification_service._notification_history[service_info.service_name] = NotificationHistory(
-        service_name=service_info.service_name,
-        last_notification=datetime.now(timezone.utc),
-        last_status=service_info.status,
-        notification_count=1,
-    )
+    notification_service._notification_history[service_info.service_name] = make_history()
 
     notification_service.clear_notification_history()
     assert len(notification_service._notification_history) == 0
 
 
-@pytest.mark.asyncio
-async def test_send_email_success(notification_service):
+async def test_send_email_success(notification_service, monkeypatch):
     """Test successful email sending."""
-    with patch.object(notification_service._client, "post") as mock_post:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        mock_post.return_value = mock_response
-
-        result = await notification_service._send_email(
-            "test@example.com", "Test Subject", "Test Message", "<html>Test</html>"
-        )
+    requests = []
 
-        assert result is True
-        mock_post.assert_called_once()
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"success": True})
 
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(notification_service, "_client", client)
 
-def test_recovery_notification_bypasses_cooldown(notification_service):
+    result = await notification_service._send_email(
+        "test@example.com", "Test Subject", "Test Message", "<html>Test</html>"
+    )
+    await client.aclose()
+
+    assert result is True
+    [request] = requests
+    assert request.url == notification_service._send_url
+    assert json.loads(request.content)["to"] == "test@example.com"
+
+
+async def test_send_email_does_not_retry_client_errors(notification_service):
+    """Test that a rejected request is not retried."""
+    with (
+        patch.object(notification_service._client, "post") as mock_post,
+        patch("service_monitor.notifications.asyncio.sleep") as mock_sleep,
+    ):
+        mock_post.return_value = Mock(status_code=400, text="bad request")
+
+        result = await notification_service._send_email("test@example.com", "Subject", "Message", "<html></html>")
+
+    assert result is False
+    mock_post.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+async def test_send_email_honours_retry_after(notification_service):
+    """Test that a throttled send waits for the server's Retry-After before retrying."""
+    throttled = Mock(status_code=429, text="slow down", headers={"Retry-After": "2"})
+
+    with (
+        patch.object(notification_service._client, "post", side_effect=[throttled, _FAKE_OK_RESPONSE]) as mock_post,
+        patch("service_monitor.notifications.asyncio.sleep") as mock_sleep,
+    ):
+        result = await notification_service._send_email("test@example.com", "Subject", "Message", "<html></html>")
+
+    assert result is True
+    assert mock_post.call_count == 2
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+def test_retry_delay_backs_off_with_jitter():
+    """Test that retry delays are jittered within an exponentially growing, capped window."""
+    with patch("service_monitor.notifications.config.notifications.retry_delay_seconds", 5):
+        for attempt in range(4):
+            for _ in range(20):
+                assert 0 <= _retry_delay(attempt) <= min(30, 5 * 2**attempt)
+        assert _retry_delay(0, retry_after=120) == 30
+
+
+async def test_open_recreates_closed_client(notification_service):
+    """Test that the shared HTTP client is reused while open and recreated after close."""
+    client = notification_service._client
+    await notification_service.open()
+    assert notification_service._client is client
+
+    await notification_service.close()
+    await notification_service.open()
+    assert notification_service._client is not client
+    assert not notification_service._client.is_closed
+
+
+def test_recovery_notification_bypasses_cooldown(notification_service, make_history):
     """Test that recovery notifications bypass the cooldown period."""
     # Create a service that went DOWN
     down_service = ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.DOWN,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         check_in_count=1,
     )
 
@@ -186,18 +301,13 @@ def test_recovery_notification_bypasses_cooldown(notification_service):
     assert notification_service._should_send_notification(down_service, previous_status=ServiceStatus.UP)
 
     # Simulate that a notification was just sent (within cooldown period)
-    notification_service._notification_history[down_service.service_name] = NotificationHistory(
-        service_name=down_service.service_name,
-        last_notification=datetime.now(timezone.utc),  # Just now
-        last_status=ServiceStatus.DOWN,
-        notification_count=1,
-    )
+    notification_service._notification_history[down_service.service_name] = make_history()
 
     # Service recovers immediately (within cooldown period)
     recovered_service = ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.UP,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         check_in_count=2,
     )
 
@@ -205,13 +315,13 @@ def test_recovery_notification_bypasses_cooldown(notification_service):
     assert notification_service._should_send_notification(recovered_service, previous_status=ServiceStatus.DOWN)
 
 
-def test_alert_notification_respects_cooldown(notification_service):
+def test_alert_notification_respects_cooldown(notification_service, make_history):
     """Test that alert notifications respect the cooldown period."""
     # Create a service that went DOWN
     down_service = ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.DOWN,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         check_in_count=1,
     )
 
@@ -219,20 +329,106 @@ def test_alert_notification_respects_cooldown(notification_service):
     assert notification_service._should_send_notification(down_service, previous_status=ServiceStatus.UP)
 
     # Simulate that a notification was just sent (within cooldown period)
-    notification_service._notification_history[down_service.service_name] = NotificationHistory(
-        service_name=down_service.service_name,
-        last_notification=datetime.now(timezone.utc),  # Just now
-        last_status=ServiceStatus.DOWN,
-        notification_count=1,
-    )
+    notification_service._notification_history[down_service.service_name] = make_history()
 
     # Service goes DEGRADED immediately (still a problem state, within cooldown)
     degraded_service = ServiceInfo(
         service_name="test-service",
         status=ServiceStatus.DEGRADED,
-        last_check_in=datetime.now(timezone.utc),
+        last_check_in=FROZEN_NOW,
         check_in_count=2,
     )
 
     # Second alert notification should NOT be sent (cooldown active)
     assert not notification_service._should_send_notification(degraded_service, previous_status=ServiceStatus.DOWN)
+
+    # Once the cooldown deadline passes, alerts are sent again
+    notification_service._notification_history[down_service.service_name].next_allowed_monotonic = time.monotonic() - 1
+    assert notification_service._should_send_notification(degraded_service, previous_status=ServiceStatus.DOWN)
+
+
+async def test_send_service_notifications_batch_sends_single_digest(notification_service):
+    """Test that several status changes are coalesced into one email per recipient."""
+    down_services = [
+        ServiceInfo(
+            service_name=f"stale-service-{index}",
+            status=ServiceStatus.DOWN,
+            last_check_in=FROZEN_NOW,
+            message="No check-in for 151s (timeout: 150s)",
+            check_in_count=1,
+        )
+        for index in range(3)
+    ]
+
+    with patch.object(notification_service, "_send_email", return_value=True) as mock_send:
+        result = await notification_service.send_service_notifications_batch(
+            [(service, ServiceStatus.UP) for service in down_services]
+        )
+
+    assert result is True
+    mock_send.assert_called_once()
+    _, subject, plain_text, html_content = mock_send.call_args.args
+    assert "3 services" in subject
+    for service in down_services:
+        assert service.service_name in plain_text
+        assert service.service_name in html_content
+        assert notification_service._notification_history[service.service_name].notification_count == 1
+
+
+@pytest.mark.parametrize(
+    ("statuses", "subject_prefix", "heading"),
+    [
+        ([ServiceStatus.UP, ServiceStatus.UP], "🎉 Service Recovered: ", "Service Monitor Recovery"),
+        ([ServiceStatus.UP, ServiceStatus.DOWN], "🔔 Service Status Update: ", "Service Monitor Status Update"),
+        ([ServiceStatus.DOWN, ServiceStatus.DEGRADED], "🚨 Service Alert: ", "Service Monitor Alert"),
+    ],
+)
+def test_digest_wording_follows_its_contents(notification_service, statuses, subject_prefix, heading):
+    """Test that digests of recoveries, alerts, or a mix of both are worded accordingly."""
+    changes = [
+        (
+            ServiceInfo(service_name=f"service-{index}", status=status, last_check_in=FROZEN_NOW, check_in_count=2),
+            ServiceStatus.DOWN if status is ServiceStatus.UP else ServiceStatus.UP,
+        )
+        for index, status in enumerate(statuses)
+    ]
+
+    subject, plain_text, _ = notification_service._generate_digest_content(changes)
+
+    assert subject.startswith(subject_prefix)
+    assert plain_text.startswith(heading)
+
+
+async def test_send_service_notifications_batch_skips_cooldown(notification_service, service_info, make_history):
+    """Test that services in cooldown are filtered out before the digest is sent."""
+    notification_service._notification_history[service_info.service_name] = make_history()
+
+    with patch.object(notification_service, "_send_email", return_value=True) as mock_send:
+        result = await notification_service.send_service_notifications_batch([(service_info, ServiceStatus.UP)])
+
+    assert result is False
+    mock_send.assert_not_called()
+
+
+async def test_send_to_recipients_sends_concurrently(notification_service):
+    """Test that recipients are emailed concurrently and only successful sends are counted."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send_email(to, subject, message, html_content):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return to != "bad@example.com"
+
+    recipients = ["a@example.com", "b@example.com", "bad@example.com"]
+    with (
+        patch("service_monitor.notifications.config.notifications.recipients", recipients),
+        patch.object(notification_service, "_send_email", side_effect=send_email),
+    ):
+        success_count = await notification_service._send_to_recipients("subject", "text", "<p>html</p>")
+
+    assert success_count == 2
+    assert max_in_flight == 3
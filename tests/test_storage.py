@@ -1,19 +1,30 @@
 """Tests for the storage layer."""
 
-from datetime import datetime
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
+from pydantic import TypeAdapter
 
-from service_monitor.models import ServiceStatus
+from service_monitor.models import ServiceCheckIn, ServiceInfo, ServiceStatus
 from service_monitor.storage import InMemoryStorage
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def storage():
-    """Create a fresh storage instance for each test."""
+    """Create one storage instance shared by the tests in this module."""
     return InMemoryStorage()
 
 
+@pytest.fixture(autouse=True)
+def _reset_storage(storage):
+    """Empty the shared storage after each test."""
+    yield
+    storage.clear()
+
+
 def test_storage_initialization(storage):
     """Test storage initialization."""
     assert storage.get_service_count() == 0
@@ -31,25 +42,28 @@ def test_update_new_service(storage):
     assert service.message == "Initial startup"
     assert service.metadata["version"] == "1.0.0"
     assert service.check_in_count == 1
-    assert isinstance(service.last_check_in, datetime)
+    assert type(service.last_check_in) is datetime
     assert previous_status is None  # New service, so no previous status
 
 
 def test_update_existing_service(storage):
     """Test updating a service that already exists."""
-    # First check-in
-    service1, previous_status1 = storage.update_service(
-        service_name="existing-service", status=ServiceStatus.UP, message="First check-in"
-    )
-    first_checkin_time = service1.last_check_in
-
-    # Second check-in
-    service2, previous_status2 = storage.update_service(
-        service_name="existing-service",
-        status=ServiceStatus.DEGRADED,
-        message="Performance issues",
-        metadata={"load": "high"},
-    )
+    # Check-ins one second apart, so the later check-in time is strictly greater
+    check_in_ns = 1_700_000_000 * 1_000_000_000
+    with patch("service_monitor.storage.time.time_ns", side_effect=[check_in_ns, check_in_ns + 1_000_000_000]):
+        # First check-in
+        service1, previous_status1 = storage.update_service(
+            service_name="existing-service", status=ServiceStatus.UP, message="First check-in"
+        )
+        first_checkin_time = service1.last_check_in
+
+        # Second check-in
+        service2, previous_status2 = storage.update_service(
+            service_name="existing-service",
+            status=ServiceStatus.DEGRADED,
+            message="Performance issues",
+            metadata={"load": "high"},
+        )
 
     assert service2.service_name == "existing-service"
     assert service2.status == ServiceStatus.DEGRADED
@@ -61,6 +75,25 @@ def test_update_existing_service(storage):
     assert previous_status2 == ServiceStatus.UP  # Status changed from UP to DEGRADED
 
 
+def test_update_service_heartbeat(storage):
+    """Test that an unchanged check-in only bumps the check-in time and count."""
+    service1, _ = storage.update_service(
+        service_name="heartbeat", status=ServiceStatus.UP, message="OK", metadata={"version": "1.0"}
+    )
+    first_checkin_time = service1.last_check_in
+
+    service2, previous_status = storage.update_service(
+        service_name="heartbeat", status=ServiceStatus.UP, message="OK", metadata={"version": "1.0"}
+    )
+
+    assert service1.check_in_count == 1  # Returned objects are snapshots, not live records
+    assert previous_status is None
+    assert service2.check_in_count == 2
+    assert service2.last_check_in >= first_checkin_time
+    assert service2.metadata == {"version": "1.0"}
+    assert storage.get_status_counts()["up"] == 1
+
+
 def test_update_service_metadata_merge(storage):
     """Test that metadata is merged on subsequent updates."""
     # First check-in with initial metadata
@@ -108,8 +141,7 @@ def test_get_all_services(storage):
         ("service-3", ServiceStatus.DEGRADED),
     ]
 
-    for name, status in services_data:
-        storage.update_service(name, status)
+    storage.update_services_batch([ServiceCheckIn(service_name=name, status=status) for name, status in services_data])
 
     # Get all services
     all_services = storage.get_all_services()
@@ -121,6 +153,57 @@ def test_get_all_services(storage):
     assert "service-3" in service_names
 
 
+def test_get_all_services_json(storage):
+    """Test that cached per-service JSON matches a fresh serialization and tracks updates."""
+    adapter = TypeAdapter(list[ServiceInfo])
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.DOWN)
+    assert storage.get_all_services_json() == adapter.dump_json(storage.get_all_services())
+
+    storage.update_service("service-1", ServiceStatus.DEGRADED, message="Slow")
+    storage.remove_service("service-2")
+    assert storage.get_all_services_json() == adapter.dump_json(storage.get_all_services())
+    assert json.loads(storage.get_all_services_json())[0]["status"] == "degraded"
+
+
+def test_service_snapshots_do_not_track_later_updates(storage):
+    """Test that a returned ServiceInfo keeps its values after the stored service changes."""
+    snapshot, _ = storage.update_service("service-1", ServiceStatus.UP, metadata={"version": "1.0.0"})
+    storage.update_service("service-1", ServiceStatus.DEGRADED, metadata={"version": "1.1.0"})
+
+    assert snapshot.status == ServiceStatus.UP
+    assert snapshot.metadata == {"version": "1.0.0"}
+    assert storage.get_service("service-1").metadata == {"version": "1.1.0"}
+
+
+def test_metadata_added_later_is_kept_per_service(storage):
+    """Test that services checking in without metadata can later gain metadata independently."""
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.UP)
+
+    storage.update_service("service-1", ServiceStatus.DEGRADED, metadata={"region": "us-west-2"})
+
+    assert storage.get_service("service-1").metadata == {"region": "us-west-2"}
+    assert storage.get_service("service-2").metadata == {}
+    assert storage.update_service("service-3", ServiceStatus.UP)[0].metadata == {}
+
+
+def test_get_services_by_status_json(storage):
+    """Test that per-status JSON matches a fresh serialization of the status bucket."""
+    adapter = TypeAdapter(list[ServiceInfo])
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.DOWN)
+    storage.update_service("service-3", ServiceStatus.UP)
+    storage.get_all_services_json()
+
+    storage.update_service("service-3", ServiceStatus.DOWN)
+    for status in ServiceStatus:
+        expected = adapter.dump_json(storage.get_services_by_status(status))
+        assert storage.get_services_by_status_json(status) == expected
+    down = json.loads(storage.get_services_by_status_json(ServiceStatus.DOWN))
+    assert [service["service_name"] for service in down] == ["service-2", "service-3"]
+
+
 def test_remove_service_existing(storage):
     """Test removing a service that exists."""
     # Add a service
@@ -140,9 +223,33 @@ def test_remove_service_nonexistent(storage):
     assert result is False
 
 
-def test_get_services_by_status(storage):
+def test_clear_removes_all_services(storage):
+    """Test that clearing empties every index and still advances the version."""
+    storage.update_service("up-service", ServiceStatus.UP)
+    storage.update_service("down-service", ServiceStatus.DOWN)
+    version = storage.version
+
+    storage.clear()
+
+    assert storage.get_service_count() == 0
+    assert storage.get_all_services_json() == b"[]"
+    assert storage.get_critical_services() == []
+    assert set(storage.get_status_counts().values()) == {0}
+    assert storage.seconds_until_next_stale(timeout_seconds=150) == 150
+    assert storage.version > version
+
+
+@pytest.mark.parametrize(
+    ("status", "expected_names"),
+    [
+        (ServiceStatus.UP, {"up-service-1", "up-service-2"}),
+        (ServiceStatus.DOWN, {"down-service"}),
+        (ServiceStatus.DEGRADED, {"degraded-service"}),
+        (ServiceStatus.UNKNOWN, {"unknown-service"}),
+    ],
+)
+def test_get_services_by_status(storage, status, expected_names):
     """Test filtering services by status."""
-    # Add services with different statuses
     services_data = [
         ("up-service-1", ServiceStatus.UP),
         ("up-service-2", ServiceStatus.UP),
@@ -150,29 +257,19 @@ def test_get_services_by_status(storage):
         ("degraded-service", ServiceStatus.DEGRADED),
         ("unknown-service", ServiceStatus.UNKNOWN),
     ]
+    storage.update_services_batch([ServiceCheckIn(service_name=name, status=status) for name, status in services_data])
 
-    for name, status in services_data:
-        storage.update_service(name, status)
+    services = storage.get_services_by_status(status)
 
-    # Test filtering by UP status
-    up_services = storage.get_services_by_status(ServiceStatus.UP)
-    assert len(up_services) == 2
-    for service in up_services:
-        assert service.status == ServiceStatus.UP
+    assert {service.service_name for service in services} == expected_names
+    assert all(service.status == status for service in services)
 
-    # Test filtering by DOWN status
-    down_services = storage.get_services_by_status(ServiceStatus.DOWN)
-    assert len(down_services) == 1
-    assert down_services[0].service_name == "down-service"
-
-    # Test filtering by status with no matches
-    # First remove all services and add only non-UP services
-    for name, _ in services_data:
-        storage.remove_service(name)
 
+def test_get_services_by_status_without_matches(storage):
+    """Test that filtering by a status no service has returns an empty list."""
     storage.update_service("test-down", ServiceStatus.DOWN)
-    up_services = storage.get_services_by_status(ServiceStatus.UP)
-    assert len(up_services) == 0
+
+    assert storage.get_services_by_status(ServiceStatus.UP) == []
 
 
 def test_get_service_count(storage):
@@ -213,3 +310,143 @@ def test_service_empty_metadata(storage):
 
     assert service.metadata == {}
     assert previous_status is None
+
+
+def test_get_status_counts(storage):
+    """Test that status counts track updates, removals, and stale transitions."""
+    assert storage.get_status_counts() == {"up": 0, "down": 0, "degraded": 0, "unknown": 0}
+
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.UP)
+    storage.update_service("service-3", ServiceStatus.DOWN)
+    assert storage.get_status_counts() == {"up": 2, "down": 1, "degraded": 0, "unknown": 0}
+
+    # Status transition moves the service between counts
+    storage.update_service("service-1", ServiceStatus.DEGRADED)
+    assert storage.get_status_counts() == {"up": 1, "down": 1, "degraded": 1, "unknown": 0}
+
+    # Removal decrements the count for the current status
+    storage.remove_service("service-3")
+    assert storage.get_status_counts() == {"up": 1, "down": 0, "degraded": 1, "unknown": 0}
+
+    # Stale services are counted as DOWN
+    stale = storage.check_stale_services(timeout_seconds=-1)
+    assert len(stale) == 2
+    assert storage.get_status_counts() == {"up": 0, "down": 2, "degraded": 0, "unknown": 0}
+
+
+def test_get_critical_services(storage):
+    """Test that critical services are returned DOWN first, sorted by name."""
+    storage.update_service("b-degraded", ServiceStatus.DEGRADED)
+    storage.update_service("z-down", ServiceStatus.DOWN)
+    storage.update_service("a-up", ServiceStatus.UP)
+    storage.update_service("a-degraded", ServiceStatus.DEGRADED)
+    storage.update_service("c-down", ServiceStatus.DOWN)
+
+    critical = [service.service_name for service in storage.get_critical_services()]
+    assert critical == ["c-down", "z-down", "a-degraded", "b-degraded"]
+
+    # Ordering is kept as services move between buckets or are removed
+    storage.update_service("a-degraded", ServiceStatus.DOWN)
+    storage.update_service("z-down", ServiceStatus.UP)
+    storage.remove_service("c-down")
+
+    critical = [service.service_name for service in storage.get_critical_services()]
+    assert critical == ["a-degraded", "b-degraded"]
+
+
+def test_check_stale_services_ignores_superseded_check_ins(storage):
+    """Test that only the latest check-in of each service is considered for staleness."""
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.DOWN)
+    storage.update_service("service-3", ServiceStatus.UP)
+    storage.remove_service("service-3")
+    assert storage.seconds_until_next_stale(timeout_seconds=150) > 0
+    # Only UP and DEGRADED services are tracked for staleness
+    assert list(storage._check_in_order) == ["service-1"]
+
+    stale = storage.check_stale_services(timeout_seconds=-1)
+    assert [(service.service_name, previous) for service, previous in stale] == [("service-1", ServiceStatus.UP)]
+    assert stale[0][0].status == ServiceStatus.DOWN
+    assert "No check-in for" in stale[0][0].message
+
+    # Already-stale services are not reported twice, and nothing is left to wait for
+    assert storage.check_stale_services(timeout_seconds=-1) == []
+    assert storage.seconds_until_next_stale(timeout_seconds=150) == 150
+
+
+def test_check_in_times_are_tracked_in_nanoseconds(storage):
+    """Test that check-in times keep nanosecond precision and drive the stale deadline."""
+    check_in_ns = 1_700_000_000_123_456_789
+    with patch("service_monitor.storage.time.time_ns", return_value=check_in_ns):
+        service, _ = storage.update_service("service-1", ServiceStatus.UP)
+    assert service.last_check_in == datetime.fromtimestamp(check_in_ns / 1e9, timezone.utc)
+
+    with patch("service_monitor.storage.time.time_ns", return_value=check_in_ns + 100 * 1_000_000_000):
+        assert storage.seconds_until_next_stale(timeout_seconds=150) == 50.0
+        assert storage.check_stale_services(timeout_seconds=150) == []
+        [(stale, _)] = storage.check_stale_services(timeout_seconds=60)
+    assert stale.message == "No check-in for 100s (timeout: 60s)"
+
+
+def test_heartbeats_keep_one_entry_and_push_back_the_deadline(storage):
+    """Test that repeated identical check-ins keep one tracked entry and still defer staleness."""
+    start_ns = 1_700_000_000 * 1_000_000_000
+    for offset in (0, 50, 100):
+        with patch("service_monitor.storage.time.time_ns", return_value=start_ns + offset * 1_000_000_000):
+            storage.update_service("service-1", ServiceStatus.UP)
+    assert list(storage._check_in_order) == ["service-1"]
+
+    with patch("service_monitor.storage.time.time_ns", return_value=start_ns + 200 * 1_000_000_000):
+        assert storage.check_stale_services(timeout_seconds=150) == []
+        assert storage.seconds_until_next_stale(timeout_seconds=150) == 50.0
+    with patch("service_monitor.storage.time.time_ns", return_value=start_ns + 251 * 1_000_000_000):
+        [(stale, _)] = storage.check_stale_services(timeout_seconds=150)
+    assert stale.message == "No check-in for 151s (timeout: 150s)"
+
+
+def test_iter_stale_services_marks_services_as_consumed(storage):
+    """Test that stale services are only marked DOWN as the iterator reaches them."""
+    storage.update_service("service-1", ServiceStatus.UP)
+    storage.update_service("service-2", ServiceStatus.DEGRADED)
+
+    stale = storage.iter_stale_services(timeout_seconds=-1)
+    first, previous = next(stale)
+    assert (first.service_name, previous) == ("service-1", ServiceStatus.UP)
+    assert storage.get_service("service-2").status == ServiceStatus.DEGRADED
+    stale.close()
+
+    # Services the iterator never reached are picked up by the next sweep
+    assert [service.service_name for service, _ in storage.check_stale_services(timeout_seconds=-1)] == ["service-2"]
+
+
+async def test_wait_for_stale_deadline_wakes_on_first_check_in(storage):
+    """Test that a waiting stale checker is woken when the first check-in arrives."""
+    waiter = asyncio.create_task(storage.wait_for_stale_deadline(timeout_seconds=150))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    storage.update_service("first-service", ServiceStatus.UP)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+def test_status_versions_ignore_heartbeats(storage):
+    """Test that status and critical versions move on status changes only, including stale sweeps."""
+    storage.update_service("api", ServiceStatus.UP)
+    storage.update_service("worker", ServiceStatus.DOWN)
+    status_version, critical_version = storage.status_version, storage.critical_version
+
+    storage.update_service("api", ServiceStatus.UP)
+    storage.update_service("worker", ServiceStatus.DOWN, message="still down")
+    assert (storage.status_version, storage.critical_version) == (status_version, critical_version)
+
+    storage.update_service("cron", ServiceStatus.UP)
+    assert storage.status_version > status_version
+    assert storage.critical_version == critical_version
+
+    storage.check_stale_services(timeout_seconds=-1)
+    assert storage.critical_version > critical_version
+
+    critical_version = storage.critical_version
+    storage.clear()
+    assert storage.critical_version > critical_version